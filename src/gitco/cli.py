@@ -4,6 +4,7 @@ This is the main CLI module that orchestrates all command groups.
 Each command group is organized into separate modules for maintainability.
 """
 
+import importlib
 from typing import Optional
 
 import click
@@ -16,8 +17,62 @@ from .utils.common import (
     setup_logging,
 )
 
+# Maps each top-level command name to the cli submodule that defines it.
+_LAZY_COMMANDS = {
+    "init": "core",
+    "sync": "core",
+    "analyze": "core",
+    "discover": "core",
+    "status": "core",
+    "activity": "core",
+    "logs": "core",
+    "performance": "core",
+    "version": "core",
+    "help": "core",
+    "completion": "core",
+    "validate-repo": "core",
+    "config": "config",
+    "upstream": "upstream",
+    "github": "github",
+    "contributions": "contributions",
+    "backup": "backup",
+    "cost": "cost",
+}
+
+
+def _mb_to_bytes(
+    ctx: click.Context, param: click.Parameter, value: Optional[int]
+) -> Optional[int]:
+    """Convert a size option given in MB to bytes."""
+    return value * 1024 * 1024 if value else None
+
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules only when a command is resolved.
+
+    Keeps ``gitco --version`` and single-command invocations from importing
+    every command module (and their YAML/Git/HTTP/LLM dependencies).
+    """
 
-@click.group()
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return all command names without importing their modules."""
+        return sorted(set(_LAZY_COMMANDS) | set(self.commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Import and register the module defining ``cmd_name`` on first use."""
+        if cmd_name not in self.commands and cmd_name in _LAZY_COMMANDS:
+            module_name = _LAZY_COMMANDS[cmd_name]
+            try:
+                module = importlib.import_module(f".cli.{module_name}", __package__)
+            except ImportError as e:
+                console.print(f"[red]Warning: Could not load command module: {e}[/red]")
+                console.print("[yellow]Some commands may not be available.[/yellow]")
+                return None
+            getattr(module, f"register_{module_name}_commands")(self)
+        return self.commands.get(cmd_name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="gitco")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
@@ -30,7 +85,9 @@ from .utils.common import (
 )
 @click.option(
     "--max-log-size",
+    "max_file_size",
     type=int,
+    callback=_mb_to_bytes,
     help="Maximum log file size in MB before rotation (default: 10)",
 )
 @click.option(
@@ -58,7 +115,7 @@ def main(
     debug: bool,
     log_file: Optional[str],
     detailed_log: bool,
-    max_log_size: Optional[int],
+    max_file_size: Optional[int],
     log_backups: Optional[int],
     config: Optional[str],
     log_level: Optional[str],
@@ -81,7 +138,7 @@ def main(
     ctx.obj["debug"] = debug
     ctx.obj["log_file"] = log_file
     ctx.obj["detailed_log"] = detailed_log
-    ctx.obj["max_log_size"] = max_log_size
+    ctx.obj["max_file_size"] = max_file_size
     ctx.obj["log_backups"] = log_backups
     ctx.obj["config"] = config
     ctx.obj["log_level"] = log_level
@@ -91,11 +148,6 @@ def main(
     # Set global quiet mode state
     set_quiet_mode(quiet)
 
-    # Calculate max file size in bytes if specified
-    max_file_size = None
-    if max_log_size:
-        max_file_size = max_log_size * 1024 * 1024  # Convert MB to bytes
-
     # Setup logging with enhanced options
     setup_logging(
         verbose=verbose or debug,
@@ -111,30 +163,5 @@ def main(
     logger.debug("GitCo CLI started")
 
 
-# Register all command groups from modular structure
-try:
-    from .cli.backup import register_backup_commands
-    from .cli.config import register_config_commands
-    from .cli.contributions import register_contributions_commands
-    from .cli.core import register_core_commands
-    from .cli.cost import register_cost_commands
-    from .cli.github import register_github_commands
-    from .cli.upstream import register_upstream_commands
-
-    # Register all command groups
-    register_core_commands(main)
-    register_config_commands(main)
-    register_upstream_commands(main)
-    register_github_commands(main)
-    register_contributions_commands(main)
-    register_backup_commands(main)
-    register_cost_commands(main)
-
-except ImportError as e:
-    # Fallback to show at least the main group structure
-    console.print(f"[red]Warning: Could not load all command modules: {e}[/red]")
-    console.print("[yellow]Some commands may not be available.[/yellow]")
-
-
 if __name__ == "__main__":
     main()
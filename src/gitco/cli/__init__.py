@@ -2,15 +2,31 @@
 
 This module provides a modular CLI structure for GitCo commands.
 Each command group is organized into separate modules for maintainability.
+Submodules are imported on first attribute access so that loading one
+command group does not pull in the dependencies of every other group.
 """
 
-from .backup import backup_commands
-from .config import config_commands
-from .contributions import contributions_commands
-from .core import core_commands
-from .cost import cost_commands
-from .github import github_commands
-from .upstream import upstream_commands
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "core_commands": "core",
+    "config_commands": "config",
+    "upstream_commands": "upstream",
+    "github_commands": "github",
+    "contributions_commands": "contributions",
+    "backup_commands": "backup",
+    "cost_commands": "cost",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import command registration functions from submodules."""
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "core_commands",
@@ -4,6 +4,7 @@ This module contains backup-related commands:
 create, list, restore, validate, delete, cleanup.
 """
 
+import os
 from typing import Optional
 
 import click
@@ -86,10 +87,9 @@ def create(
             repositories = [r.strip() for r in repos.split(",")]
         else:
             # Use repositories from configuration
-            if hasattr(config_data, "repositories") and config_data.repositories:
-                repositories = list(config_data.repositories.keys())
-            else:
-                repositories = []
+            repositories = [
+                os.path.expanduser(r.local_path) for r in config_data.repositories or []
+            ]
 
         if not repositories and type != "config-only":
             print_error_panel(
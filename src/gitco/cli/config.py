@@ -8,25 +8,32 @@ import json
 import os
 import subprocess
 import sys
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 import click
 import yaml
+from rich import box
+from rich.table import Table
 
 from ..libs.config import ConfigManager, get_config_manager
 from ..utils.common import (
+    console,
     get_logger,
     log_operation_failure,
     log_operation_start,
     log_operation_success,
     print_error_panel,
-    print_info_panel,
     print_success_panel,
     print_warning_panel,
 )
 from ..utils.exception import ValidationError
 
+# Repository Details columns, projected in one call per row
+_REPO_ROW = attrgetter("name", "fork", "upstream")
+
 
 def register_config_commands(main_group):
     """Register all config commands with the main CLI group."""
@@ -70,8 +77,6 @@ def validate(
 
         # Export report if requested
         if export:
-            from datetime import datetime
-
             export_data = {
                 "timestamp": datetime.now().isoformat(),
                 "config_path": str(config_manager.config_path),
@@ -175,31 +180,37 @@ def show(ctx: click.Context) -> None:
         log_operation_success("configuration status", repo_count=repo_count)
         print_success_panel("Configuration Status", f"Found {repo_count} repositories")
 
-        print_info_panel(
-            "Configuration File", f"Configuration file: {config_manager.config_path}"
-        )
-        print_info_panel("Repositories", f"Repositories: {repo_count}")
-        print_info_panel(
-            "LLM Provider", f"LLM provider: {config.settings.llm_provider}"
-        )
-        print_info_panel(
-            "Analysis Enabled", f"Analysis enabled: {config.settings.analysis_enabled}"
+        settings_table = Table(
+            title="Configuration",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta",
         )
-        print_info_panel(
-            "Max Repos per Batch",
-            f"Max repos per batch: {config.settings.max_repos_per_batch}",
-        )
-
-        if config.repositories is not None and config.repositories:
-            print_info_panel("Repository Details", "Repository Details:")
-            for repo_name, repo_info in config.repositories.items():
-                if hasattr(repo_info, "fork") and hasattr(repo_info, "upstream"):
-                    print_info_panel(
-                        "Repository",
-                        f"  - {repo_name}: {repo_info.fork} -> {repo_info.upstream}",
-                    )
-                else:
-                    print_info_panel("Repository", f"  - {repo_name}")
+        settings_table.add_column("Setting", style="cyan")
+        settings_table.add_column("Value", style="white")
+        for row in (
+            ("Configuration File", str(config_manager.config_path)),
+            ("Repositories", str(repo_count)),
+            ("LLM Provider", config.settings.llm_provider),
+            ("Analysis Enabled", str(config.settings.analysis_enabled)),
+            ("Max Repos per Batch", str(config.settings.max_repos_per_batch)),
+        ):
+            settings_table.add_row(*row)
+        console.print(settings_table)
+
+        if config.repositories:
+            repo_table = Table(
+                title="Repository Details",
+                box=box.ROUNDED,
+                show_header=True,
+                header_style="bold magenta",
+            )
+            repo_table.add_column("Name", style="cyan")
+            repo_table.add_column("Fork", style="white")
+            repo_table.add_column("Upstream", style="white")
+            for repo_info in config.repositories:
+                repo_table.add_row(*_REPO_ROW(repo_info))
+            console.print(repo_table)
 
     except FileNotFoundError as e:
         log_operation_failure("configuration status", e)
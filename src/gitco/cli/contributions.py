@@ -7,20 +7,22 @@ sync-history, stats, recommendations, export, trending.
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
 from ..libs.config import get_config_manager
-from ..libs.exporter import export_contribution_data_to_csv
-from ..libs.github_client import create_github_client
 from ..utils.common import (
     print_error_panel,
     print_info_panel,
+    print_info_panels,
     print_success_panel,
     print_warning_panel,
 )
 
+if TYPE_CHECKING:
+    from ..libs.contribution_tracker import Contribution, ContributionTracker
+
 
 def register_contributions_commands(main_group):
     """Register all contributions commands with the main CLI group."""
@@ -38,20 +40,48 @@ def register_contributions_commands(main_group):
     main_group.add_command(contributions_group)
 
 
+def _load_contributions_since(
+    tracker: "ContributionTracker", days: Optional[int]
+) -> list["Contribution"]:
+    """Load the contribution history, limited to the last ``days`` days if set.
+
+    Args:
+        tracker: Contribution tracker to load the history from
+        days: Keep only contributions created in the last N days
+
+    Returns:
+        List of contributions
+    """
+    contributions = tracker.load_contribution_history()
+    if days:
+        cutoff_date = datetime.now() - timedelta(days=days)
+        contributions = [c for c in contributions if c.created_datetime >= cutoff_date]
+    return contributions
+
+
 @click.command()
 @click.option("--username", required=True, help="GitHub username to sync")
 @click.option("--force", "-f", is_flag=True, help="Force sync even if recent")
 @click.option("--days", type=int, help="Sync contributions from last N days")
+@click.option(
+    "--workers", type=int, default=4, help="Maximum concurrent GitHub requests"
+)
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
 @click.pass_context
 def sync_history(
-    ctx: click.Context, username: str, force: bool, days: Optional[int], quiet: bool
+    ctx: click.Context,
+    username: str,
+    force: bool,
+    days: Optional[int],
+    workers: int,
+    quiet: bool,
 ) -> None:
     """Sync contribution history from GitHub."""
-    print_info_panel(
-        "Syncing Contribution History",
-        f"Fetching contributions for user: {username}",
-    )
+    if not quiet:
+        print_info_panel(
+            "Syncing Contribution History",
+            f"Fetching contributions for user: {username}",
+        )
 
     try:
         # Load configuration
@@ -59,11 +89,13 @@ def sync_history(
         config = config_manager.load_config()
 
         # Create GitHub client
+        from ..libs.github_client import create_github_client
+
         github_credentials = config_manager.get_github_credentials()
         github_client = create_github_client(
-            token=github_credentials.get("token"),  # type: ignore
-            username=github_credentials.get("username"),  # type: ignore
-            password=github_credentials.get("password"),  # type: ignore
+            token=github_credentials.token,
+            username=github_credentials.username,
+            password=github_credentials.password,
             base_url=config.settings.github_api_url,
         )
 
@@ -78,15 +110,18 @@ def sync_history(
         # Create contribution tracker
         from ..libs.contribution_tracker import create_contribution_tracker
 
-        tracker = create_contribution_tracker(config, github_client)
+        tracker = create_contribution_tracker(
+            config, github_client, max_workers=workers
+        )
 
         # Sync contributions
         tracker.sync_contributions_from_github(username, force=force, days=days)
 
-        print_success_panel(
-            "Sync Completed",
-            f"✅ Successfully synced contributions for {username}",
-        )
+        if not quiet:
+            print_success_panel(
+                "Sync Completed",
+                f"✅ Successfully synced contributions for {username}",
+            )
 
     except Exception as e:
         print_error_panel(
@@ -111,87 +146,90 @@ def stats(
     quiet: bool,
 ) -> None:
     """Show contribution statistics."""
-    print_info_panel(
-        "Calculating Contribution Statistics",
-        "Analyzing your contribution history...",
-    )
+    if not quiet:
+        print_info_panel(
+            "Calculating Contribution Statistics",
+            "Analyzing your contribution history...",
+        )
 
     try:
         # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_config()
+        config = get_config_manager().load_config()
 
-        # Create GitHub client
-        github_credentials = config_manager.get_github_credentials()
-        github_client = create_github_client(
-            token=github_credentials.get("token"),  # type: ignore
-            username=github_credentials.get("username"),  # type: ignore
-            password=github_credentials.get("password"),  # type: ignore
-            base_url=config.settings.github_api_url,
-        )
-
-        # Create contribution tracker
+        # Create contribution tracker; the history is local, so no GitHub client
         from ..libs.contribution_tracker import create_contribution_tracker
 
-        tracker = create_contribution_tracker(config, github_client)
+        tracker = create_contribution_tracker(config, None)
 
         # Get statistics
         stats = tracker.get_contribution_stats(days)
 
-        # Display basic statistics
-        print_success_panel(
-            "Contribution Statistics",
-            f"📊 Total Contributions: {stats.total_contributions}\n"
-            f"📈 Open: {stats.open_contributions} | Closed: {stats.closed_contributions} | Merged: {stats.merged_contributions}\n"
-            f"🏢 Repositories: {stats.repositories_contributed_to}\n"
-            f"💡 Skills Developed: {len(stats.skills_developed)}\n"
-            f"⭐ Average Impact Score: {stats.average_impact_score:.2f}",
-        )
+        if not quiet:
+            if stats.total_contributions == 0:
+                # Nothing to break down until some history has been synced
+                print_info_panel(
+                    "No Contribution History",
+                    "No contributions recorded yet. Run 'gitco contributions "
+                    "sync-history' to import your GitHub contributions.",
+                )
+            else:
+                # Display basic statistics
+                print_success_panel(
+                    "Contribution Statistics",
+                    f"📊 Total Contributions: {stats.total_contributions}\n"
+                    f"📈 Open: {stats.open_contributions} | Closed: {stats.closed_contributions} | Merged: {stats.merged_contributions}\n"
+                    f"🏢 Repositories: {stats.repositories_contributed_to}\n"
+                    f"💡 Skills Developed: {len(stats.skills_developed)}\n"
+                    f"⭐ Average Impact Score: {stats.average_impact_score:.2f}",
+                )
 
-        # Enhanced impact metrics
-        if hasattr(stats, "high_impact_contributions") and (
-            stats.high_impact_contributions > 0
-            or getattr(stats, "critical_contributions", 0) > 0
-        ):
-            impact_summary = f"🔥 High Impact: {stats.high_impact_contributions}"
-            if (
-                hasattr(stats, "critical_contributions")
-                and stats.critical_contributions > 0
-            ):
-                impact_summary += f" | 🚀 Critical: {stats.critical_contributions}"
-            print_info_panel("Impact Metrics", impact_summary)
-
-        # Trending analysis
-        if hasattr(stats, "contribution_velocity") and stats.contribution_velocity > 0:
-            velocity_trend = "📈" if stats.contribution_velocity > 0.1 else "📊"
-            print_info_panel(
-                "Contribution Velocity",
-                f"{velocity_trend} {stats.contribution_velocity:.2f} contributions/day (30d)",
-            )
+                # Enhanced impact metrics
+                if (
+                    stats.high_impact_contributions > 0
+                    or stats.critical_contributions > 0
+                ):
+                    impact_parts = [
+                        f"🔥 High Impact: {stats.high_impact_contributions}"
+                    ]
+                    if stats.critical_contributions > 0:
+                        impact_parts.append(
+                            f"🚀 Critical: {stats.critical_contributions}"
+                        )
+                    print_info_panel("Impact Metrics", " | ".join(impact_parts))
+
+                # Trending analysis
+                if stats.contribution_velocity > 0:
+                    velocity_trend = "📈" if stats.contribution_velocity > 0.1 else "📊"
+                    print_info_panel(
+                        "Contribution Velocity",
+                        f"{velocity_trend} {stats.contribution_velocity:.2f} contributions/day (30d)",
+                    )
 
-        # Show skills
-        if stats.skills_developed:
-            skills_list = ", ".join(sorted(stats.skills_developed))
-            print_info_panel(
-                "Skills Developed",
-                f"🎯 {skills_list}",
-            )
+                # Show skills
+                if stats.skills_developed:
+                    skills_list = ", ".join(sorted(stats.skills_developed))
+                    print_info_panel(
+                        "Skills Developed",
+                        f"🎯 {skills_list}",
+                    )
 
-        # Show recent activity if available
-        if hasattr(stats, "recent_activity") and stats.recent_activity:
-            print_info_panel(
-                "Recent Activity",
-                f"🕒 Last {len(stats.recent_activity)} contributions:",
-            )
-            for i, contribution in enumerate(stats.recent_activity[:5], 1):
-                print_info_panel(
-                    f"{i}. {contribution.issue_title}",
-                    f"Repository: {contribution.repository}\n"
-                    f"Type: {contribution.contribution_type}\n"
-                    f"Status: {contribution.status}\n"
-                    f"Impact: {contribution.impact_score:.2f}\n"
-                    f"Skills: {', '.join(contribution.skills_used)}",
-                )
+                # Show recent activity if available
+                if stats.recent_activity:
+                    print_info_panel(
+                        "Recent Activity",
+                        f"🕒 Last {len(stats.recent_activity)} contributions:",
+                    )
+                    print_info_panels(
+                        (
+                            f"{i}. {contribution.issue_title}",
+                            f"Repository: {contribution.repository}\n"
+                            f"Type: {contribution.contribution_type}\n"
+                            f"Status: {contribution.status}\n"
+                            f"Impact: {contribution.impact_score:.2f}\n"
+                            f"Skills: {', '.join(contribution.skills_used)}",
+                        )
+                        for i, contribution in enumerate(stats.recent_activity[:5], 1)
+                    )
 
         # Export if requested
         if export:
@@ -201,20 +239,12 @@ def stats(
                 is_csv_export = export_path.suffix.lower() == ".csv"
 
                 if is_csv_export:
-                    # Get all contributions for CSV export
-                    all_contributions = tracker.load_contribution_history()
-
-                    # Filter by days if specified
-                    if days:
-                        cutoff_date = datetime.now() - timedelta(days=days)
-                        all_contributions = [
-                            c
-                            for c in all_contributions
-                            if datetime.fromisoformat(c.created_at) >= cutoff_date
-                        ]
-
-                    # Export to CSV
-                    export_contribution_data_to_csv(all_contributions, export)
+                    # Export the contributions themselves to CSV
+                    from ..libs.exporter import export_contribution_data_to_csv
+
+                    export_contribution_data_to_csv(
+                        _load_contributions_since(tracker, days), export
+                    )
                 else:
                     # JSON export
                     export_data = {
@@ -252,10 +282,11 @@ def stats(
                     with open(export, "w", encoding="utf-8") as f:
                         json.dump(export_data, f, indent=2, ensure_ascii=False)
 
-                print_success_panel(
-                    "Export Successful",
-                    f"✅ Statistics exported to {export}",
-                )
+                if not quiet:
+                    print_success_panel(
+                        "Export Successful",
+                        f"✅ Statistics exported to {export}",
+                    )
 
             except Exception as e:
                 print_error_panel("Export Failed", f"Failed to export statistics: {e}")
@@ -285,22 +316,12 @@ def recommendations(
 
     try:
         # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_config()
-
-        # Create GitHub client
-        github_credentials = config_manager.get_github_credentials()
-        github_client = create_github_client(
-            token=github_credentials.get("token"),  # type: ignore
-            username=github_credentials.get("username"),  # type: ignore
-            password=github_credentials.get("password"),  # type: ignore
-            base_url=config.settings.github_api_url,
-        )
+        config = get_config_manager().load_config()
 
-        # Create contribution tracker
+        # Create contribution tracker; the history is local, so no GitHub client
         from ..libs.contribution_tracker import create_contribution_tracker
 
-        tracker = create_contribution_tracker(config, github_client)
+        tracker = create_contribution_tracker(config, None)
 
         # Get user skills from contributions
         stats = tracker.get_contribution_stats()
@@ -346,8 +367,8 @@ def recommendations(
             f"Found {len(recommendations)} recommendations based on your skills: {', '.join(user_skills)}",
         )
 
-        for i, recommendation in enumerate(recommendations, 1):
-            print_info_panel(
+        print_info_panels(
+            (
                 f"{i}. {recommendation.issue_title}",
                 f"Repository: {recommendation.repository}\n"
                 f"Type: {recommendation.contribution_type}\n"
@@ -355,6 +376,8 @@ def recommendations(
                 f"Impact Score: {recommendation.impact_score:.2f}\n"
                 f"URL: {recommendation.issue_url}",
             )
+            for i, recommendation in enumerate(recommendations, 1)
+        )
 
     except Exception as e:
         print_error_panel(
@@ -381,34 +404,15 @@ def export(
 
     try:
         # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_config()
-
-        # Create GitHub client
-        github_credentials = config_manager.get_github_credentials()
-        github_client = create_github_client(
-            token=github_credentials.get("token"),  # type: ignore
-            username=github_credentials.get("username"),  # type: ignore
-            password=github_credentials.get("password"),  # type: ignore
-            base_url=config.settings.github_api_url,
-        )
+        config = get_config_manager().load_config()
 
-        # Create contribution tracker
+        # Create contribution tracker; the history is local, so no GitHub client
         from ..libs.contribution_tracker import create_contribution_tracker
 
-        tracker = create_contribution_tracker(config, github_client)
+        tracker = create_contribution_tracker(config, None)
 
-        # Get all contributions
-        all_contributions = tracker.load_contribution_history()
-
-        # Filter by days if specified
-        if days:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            all_contributions = [
-                c
-                for c in all_contributions
-                if datetime.fromisoformat(c.created_at) >= cutoff_date
-            ]
+        # Get contributions for the requested period
+        all_contributions = _load_contributions_since(tracker, days)
 
         if not all_contributions:
             print_warning_panel(
@@ -421,44 +425,15 @@ def export(
         export_path = Path(output)
         is_csv_export = export_path.suffix.lower() == ".csv"
 
+        # The exporters report success or failure themselves
         if is_csv_export:
-            # Export to CSV
+            from ..libs.exporter import export_contribution_data_to_csv
+
             export_contribution_data_to_csv(all_contributions, output, include_stats)
         else:
-            # Export to JSON
-            export_data = {
-                "exported_at": datetime.now().isoformat(),
-                "period_days": days,
-                "total_contributions": len(all_contributions),
-                "contributions": [
-                    {
-                        "repository": c.repository,
-                        "issue_number": c.issue_number,
-                        "issue_title": c.issue_title,
-                        "issue_url": c.issue_url,
-                        "contribution_type": c.contribution_type,
-                        "status": c.status,
-                        "created_at": c.created_at,
-                        "updated_at": c.updated_at,
-                        "skills_used": c.skills_used,
-                        "impact_score": c.impact_score,
-                        "labels": getattr(c, "labels", []),
-                        "milestone": getattr(c, "milestone", None),
-                        "assignees": getattr(c, "assignees", []),
-                        "comments_count": getattr(c, "comments_count", 0),
-                        "reactions_count": getattr(c, "reactions_count", 0),
-                    }
-                    for c in all_contributions
-                ],
-            }
-
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            from ..libs.exporter import export_contribution_data_to_json
 
-        print_success_panel(
-            "Export Successful",
-            f"✅ Contribution data exported to {output}",
-        )
+            export_contribution_data_to_json(all_contributions, output, days)
 
     except Exception as e:
         print_error_panel(
@@ -482,22 +457,12 @@ def trending(ctx: click.Context, days: Optional[int], export: Optional[str]) ->
 
     try:
         # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_config()
+        config = get_config_manager().load_config()
 
-        # Create GitHub client
-        github_credentials = config_manager.get_github_credentials()
-        github_client = create_github_client(
-            token=github_credentials.get("token"),  # type: ignore
-            username=github_credentials.get("username"),  # type: ignore
-            password=github_credentials.get("password"),  # type: ignore
-            base_url=config.settings.github_api_url,
-        )
-
-        # Create contribution tracker
+        # Create contribution tracker; the history is local, so no GitHub client
         from ..libs.contribution_tracker import create_contribution_tracker
 
-        tracker = create_contribution_tracker(config, github_client)
+        tracker = create_contribution_tracker(config, None)
 
         # Get statistics with enhanced metrics
         stats = tracker.get_contribution_stats(days)
@@ -511,18 +476,18 @@ def trending(ctx: click.Context, days: Optional[int], export: Optional[str]) ->
         # Impact trends
         if hasattr(stats, "impact_trend_30d") and hasattr(stats, "impact_trend_7d"):
             if stats.impact_trend_30d != 0 or stats.impact_trend_7d != 0:
-                trend_summary = ""
+                trend_parts = []
                 if stats.impact_trend_30d != 0:
                     trend_icon = "📈" if stats.impact_trend_30d > 0 else "📉"
-                    trend_summary += (
-                        f"{trend_icon} 30d trend: {stats.impact_trend_30d:+.2f} "
+                    trend_parts.append(
+                        f"{trend_icon} 30d trend: {stats.impact_trend_30d:+.2f}"
                     )
                 if stats.impact_trend_7d != 0:
                     trend_icon = "📈" if stats.impact_trend_7d > 0 else "📉"
-                    trend_summary += (
+                    trend_parts.append(
                         f"{trend_icon} 7d trend: {stats.impact_trend_7d:+.2f}"
                     )
-                print_info_panel("Impact Trends", trend_summary)
+                print_info_panel("Impact Trends", " ".join(trend_parts))
 
         # Skills analysis
         if hasattr(stats, "trending_skills") and stats.trending_skills:
@@ -6,13 +6,15 @@ status, activity, logs, performance, version, help, completion, validate-repo.
 
 import os
 import sys
+import time
+from collections import Counter
 from typing import Optional
 
 import click
-import yaml
+from rich import box
+from rich.table import Table
 
 from .. import __version__
-from ..libs.config import ConfigManager, create_sample_config
 from ..utils.common import (
     console,
     get_logger,
@@ -24,6 +26,20 @@ from ..utils.common import (
     print_warning_panel,
 )
 
+# Display color for each repository health status reported by status
+_HEALTH_STATUS_COLORS = {
+    "healthy": "green",
+    "needs_attention": "yellow",
+    "critical": "red",
+}
+
+# Display color for each result status reported by validate-repo
+_VALIDATION_STATUS_COLORS = {
+    "valid": "green",
+    "invalid": "red",
+    "warning": "yellow",
+}
+
 
 def register_core_commands(main_group):
     """Register all core commands with the main CLI group."""
@@ -65,6 +81,8 @@ def init(
 
     Creates a gitco-config.yml file in the current directory with guided setup.
     """
+    from ..libs.config import ConfigManager, create_sample_config
+
     logger = get_logger()
     log_operation_start(
         "configuration initialization",
@@ -84,6 +102,8 @@ def init(
             try:
                 # Try to load the template file
                 if os.path.exists(template):
+                    import yaml
+
                     with open(template, encoding="utf-8") as f:
                         template_data = yaml.safe_load(f)
                     config = config_manager._parse_config(template_data)
@@ -218,6 +238,9 @@ def init(
 @click.option("--repo", "-r", help="Sync specific repository")
 @click.option("--batch", "-b", is_flag=True, help="Batch sync all repositories")
 @click.option("--analyze", "-a", is_flag=True, help="Run analysis after sync")
+@click.option(
+    "--no-cache", is_flag=True, help="Re-run analysis even for unchanged repositories"
+)
 @click.option("--stash", is_flag=True, help="Stash local changes before sync")
 @click.option("--force", "-f", is_flag=True, help="Force sync even if conflicts")
 @click.option("--max-repos", type=int, help="Maximum repositories per batch")
@@ -250,6 +273,7 @@ def sync(
     repo: Optional[str],
     batch: bool,
     analyze: bool,
+    no_cache: bool,
     stash: bool,
     force: bool,
     max_repos: Optional[int],
@@ -266,58 +290,130 @@ def sync(
         "repository synchronization", repo=repo, batch=batch, analyze=analyze
     )
 
+    # Only timed when the run is exported
+    start_time = time.time() if export else 0.0
+
     try:
         from ..libs.config import ConfigManager
-        from ..libs.git_ops import GitOperations
+        from ..libs.git_ops import GitRepositoryManager
 
         config_manager = ConfigManager(ctx.obj.get("config"))
         config = config_manager.load_config()
-        git_ops = GitOperations(config)
+        repositories = config.repositories or []
 
         if repo:
-            # Sync specific repository
-            result = git_ops.sync_repository(repo, stash=stash, force=force)
-            if analyze:
-                from ..libs.analyzer import Analyzer
-
-                analyzer = Analyzer(config)
-                analyzer.analyze_repository(repo)
-        elif batch:
-            # Batch sync all repositories
-            repos_to_sync = list(config.repositories.keys())
-            if max_repos:
-                repos_to_sync = repos_to_sync[:max_repos]
-
-            results = git_ops.batch_sync(
-                repos_to_sync, max_workers=max_workers, stash=stash, force=force
+            match = config.by_name.get(repo)
+            repositories = [match] if match else []
+            if not repositories:
+                print_error_panel(
+                    "Repository not found",
+                    f"Repository '{repo}' is not in the configuration.",
+                )
+                sys.exit(1)
+        elif max_repos:
+            repositories = repositories[:max_repos]
+
+        # Build each repository's sync configuration once, up front
+        repo_configs = [
+            {
+                "name": r.name,
+                "local_path": os.path.expanduser(r.local_path),
+                "upstream": r.upstream,
+                "fork": r.fork,
+            }
+            for r in repositories
+        ]
+
+        if analyze:
+            from ..libs.analyzer import ChangeAnalyzer
+
+            # Load the LLM SDK and build its client while repositories sync
+            analyzer = ChangeAnalyzer(config)
+            analyzer.prewarm()
+
+        # Sequential sync is a batch run with a single worker
+        repo_manager = GitRepositoryManager()
+        results = repo_manager.batch_sync_repositories(
+            repo_configs,
+            max_workers=max_workers if batch else 1,
+            show_progress=not quiet,
+            stash=stash,
+            force=force,
+        )
+        total_repos = len(results)
+        successful = sum(1 for r in results if r.success)
+        failed = total_repos - successful
+
+        if analyze:
+            from ..libs.git_ops import GitRepository
+
+            synced = {r.repository_name for r in results if r.success}
+            to_analyze = [
+                (repository, GitRepository(os.path.expanduser(repository.local_path)))
+                for repository in repositories
+                if repository.name in synced
+            ]
+            analyses = analyzer.analyze_repositories_batch(
+                to_analyze,
+                max_workers=max_workers if batch else 1,
+                use_cache=not no_cache,
             )
-
-            if analyze:
-                from ..libs.analyzer import Analyzer
-
-                analyzer = Analyzer(config)
-                for repo_name in repos_to_sync:
-                    analyzer.analyze_repository(repo_name)
-        else:
-            # Sync all repositories individually
-            results = git_ops.sync_all_repositories(stash=stash, force=force)
+            if not quiet:
+                for (repository, _git_repo), analysis in zip(to_analyze, analyses):
+                    if analysis:
+                        analyzer.display_analysis(analysis, repository.name)
 
         if export:
-            # Export sync report
-            import json
-
-            with open(export, "w") as f:
-                json.dump(
-                    {"sync_results": results if "results" in locals() else "completed"},
-                    f,
-                    indent=2,
-                )
+            from ..libs.exporter import export_sync_results
+
+            total_duration = time.time() - start_time
+            export_sync_results(
+                {
+                    "total_repositories": total_repos,
+                    "successful_syncs": successful,
+                    "failed_syncs": failed,
+                    "total_time": total_duration,
+                    "batch_mode": batch,
+                    "analysis_enabled": analyze,
+                    "max_workers": max_workers if batch else 1,
+                    "overall_status": "success" if failed == 0 else "partial_failure",
+                    "success_rate": successful / total_repos if total_repos else 0.0,
+                    "total_duration": total_duration,
+                    "errors": [r.message for r in results if not r.success],
+                    "repository_results": [
+                        {
+                            "name": r.repository_name,
+                            "path": r.repository_path,
+                            "success": r.success,
+                            "message": r.message,
+                            "duration": r.duration,
+                            "details": r.details,
+                        }
+                        for r in results
+                    ],
+                },
+                export,
+                repo_name=repo,
+            )
 
-        log_operation_success("repository synchronization", repo=repo, batch=batch)
+        log_operation_success(
+            "repository synchronization",
+            repo=repo,
+            batch=batch,
+            successful=successful,
+            failed=failed,
+        )
         if not quiet:
-            print_success_panel(
-                "Sync completed", "All repositories synchronized successfully"
-            )
+            if failed:
+                print_warning_panel(
+                    "Sync completed with errors",
+                    f"{failed} of {total_repos} repositories failed to sync.",
+                )
+            else:
+                print_success_panel(
+                    "Sync completed",
+                    f"{successful} repositories synchronized successfully",
+                )
 
     except Exception as e:
         log_operation_failure("repository synchronization", e, repo=repo, batch=batch)
@@ -375,7 +471,7 @@ def analyze(
         elif repos:
             repositories = [r.strip() for r in repos.split(",")]
         else:
-            repositories = list(config.repositories.keys())
+            repositories = [r.name for r in config.repositories or []]
 
         results = {}
         for repo_name in repositories:
@@ -392,10 +488,9 @@ def analyze(
             results[repo_name] = analysis_result
 
         if export:
-            import json
+            from ..libs.exporter import export_json
 
-            with open(export, "w") as f:
-                json.dump(results, f, indent=2, default=str)
+            export_json(results, export, default=str)
 
         log_operation_success("repository analysis", repo_count=len(repositories))
         if not quiet:
@@ -471,10 +566,9 @@ def discover(
         )
 
         if export:
-            import json
+            from ..libs.exporter import export_json
 
-            with open(export, "w") as f:
-                json.dump(opportunities, f, indent=2, default=str)
+            export_json(opportunities, export, default=str)
 
         if not quiet:
             console.print(
@@ -560,36 +654,21 @@ def status(
             )
 
         if export:
-            import json
+            from ..libs.exporter import export_json
 
-            with open(export, "w") as f:
-                json.dump(repositories_status, f, indent=2, default=str)
+            export_json(repositories_status, export, default=str)
 
         if not quiet:
             if overview:
                 # Show overview status
                 total_repos = len(repositories_status)
-                healthy = len(
-                    [
-                        s
-                        for s in repositories_status.values()
-                        if s.get("health_status") == "healthy"
-                    ]
-                )
-                needs_attention = len(
-                    [
-                        s
-                        for s in repositories_status.values()
-                        if s.get("health_status") == "needs_attention"
-                    ]
-                )
-                critical = len(
-                    [
-                        s
-                        for s in repositories_status.values()
-                        if s.get("health_status") == "critical"
-                    ]
+                # Bucket every repository by health status in a single pass
+                health_counts = Counter(
+                    s.get("health_status") for s in repositories_status.values()
                 )
+                healthy = health_counts["healthy"]
+                needs_attention = health_counts["needs_attention"]
+                critical = health_counts["critical"]
 
                 console.print("[green]Repository Status Overview[/green]")
                 console.print(f"Total repositories: {total_repos}")
@@ -600,11 +679,7 @@ def status(
                 # Show detailed status
                 for repo_name, status_info in repositories_status.items():
                     health = status_info.get("health_status", "unknown")
-                    color = {
-                        "healthy": "green",
-                        "needs_attention": "yellow",
-                        "critical": "red",
-                    }.get(health, "white")
+                    color = _HEALTH_STATUS_COLORS.get(health, "white")
                     console.print(f"[{color}]{repo_name}: {health}[/{color}]")
 
                     if detailed:
@@ -689,10 +764,9 @@ def activity(
             )
 
         if export:
-            import json
+            from ..libs.exporter import export_json
 
-            with open(export, "w") as f:
-                json.dump(repositories_activity, f, indent=2, default=str)
+            export_json(repositories_activity, export, default=str)
 
         if not quiet:
             console.print("[green]Repository Activity Dashboard[/green]")
@@ -788,10 +862,9 @@ def performance(
         metrics = perf_metrics.get_performance_metrics(detailed=detailed)
 
         if export:
-            import json
+            from ..libs.exporter import export_json
 
-            with open(export, "w") as f:
-                json.dump(metrics, f, indent=2, default=str)
+            export_json(metrics, export, default=str)
 
         console.print("[green]Performance Metrics[/green]")
         console.print(f"Average sync time: {metrics.get('avg_sync_time', 'N/A')}")
@@ -933,23 +1006,38 @@ def validate_repo(
             return
 
         if export:
-            import json
+            from ..libs.exporter import export_json
 
-            with open(export, "w") as f:
-                json.dump(validation_results, f, indent=2, default=str)
+            export_json(validation_results, export, default=str)
 
-        # Display results
-        console.print("[green]Repository Validation Results[/green]")
-        for repo_name, result in validation_results.items():
-            status = result.get("status", "unknown")
-            color = {"valid": "green", "invalid": "red", "warning": "yellow"}.get(
-                status, "white"
+        if not validation_results:
+            print_warning_panel(
+                "Repository Validation Results", "No repositories to validate"
             )
-            console.print(f"[{color}]{repo_name}: {status}[/{color}]")
+            log_operation_success("repository validation", repo_count=0)
+            return
 
-            if detailed and "issues" in result:
-                for issue in result["issues"]:
-                    console.print(f"  - {issue}")
+        # Display results as a single table
+        table = Table(
+            title="Repository Validation Results",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Repository", style="cyan")
+        table.add_column("Status")
+        if detailed:
+            table.add_column("Issues", style="white")
+        for repo_name, result in validation_results.items():
+            status = result.get("status", "unknown")
+            color = _VALIDATION_STATUS_COLORS.get(status, "white")
+            row = [repo_name, f"[{color}]{status}[/{color}]"]
+            if detailed:
+                row.append(
+                    "\n".join(f"- {issue}" for issue in result.get("issues", ()))
+                )
+            table.add_row(*row)
+        console.print(table)
 
         log_operation_success(
             "repository validation", repo_count=len(validation_results)
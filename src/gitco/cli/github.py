@@ -5,22 +5,26 @@ connection-status, rate-limit-status, get-repo, get-issues, get-issues-multi.
 """
 
 import sys
-from typing import Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
 import click
 
 from ..libs.config import ConfigManager
-from ..libs.github_client import create_github_client
 from ..utils.common import (
     log_operation_failure,
     log_operation_start,
     log_operation_success,
     print_error_panel,
     print_info_panel,
+    print_info_panels,
     print_success_panel,
     print_warning_panel,
 )
 
+if TYPE_CHECKING:
+    from ..libs.github_client import GitHubClient
+
 
 def register_github_commands(main_group):
     """Register all GitHub commands with the main CLI group."""
@@ -36,6 +40,57 @@ def register_github_commands(main_group):
     main_group.add_command(github_group)
 
 
+def _parse_labels(labels: Optional[str]) -> Optional[list[str]]:
+    """Parse a comma-separated label option, dropping blanks and duplicates.
+
+    Args:
+        labels: Comma-separated labels, if given
+
+    Returns:
+        Labels in the order given, or None if there are none
+    """
+    if not labels:
+        return None
+    parsed = dict.fromkeys(filter(None, map(str.strip, labels.split(","))))
+    return list(parsed) or None
+
+
+def _get_github_client(ctx: click.Context) -> "GitHubClient":
+    """Get the GitHub client for this invocation, creating it on first use.
+
+    Loads the configuration and credentials once and keeps the client in
+    ``ctx.obj`` so later lookups in the same invocation reuse it.
+
+    Args:
+        ctx: Click context
+
+    Returns:
+        Authenticated GitHub client
+    """
+    github_client = ctx.obj.get("github_client")
+    if github_client is not None:
+        return github_client
+
+    # Load configuration
+    config_manager = ConfigManager(ctx.obj.get("config"))
+    config_manager.load_config()
+
+    # Get GitHub credentials
+    credentials = config_manager.get_github_credentials()
+
+    # Create GitHub client
+    from ..libs.github_client import create_github_client
+
+    github_client = create_github_client(
+        token=credentials.token,
+        username=credentials.username,
+        password=credentials.password,
+        base_url=credentials.base_url,
+    )
+    ctx.obj["github_client"] = github_client
+    return github_client
+
+
 @click.command(name="connection-status")
 @click.option("--detailed", "-d", is_flag=True, help="Detailed connection check")
 @click.pass_context
@@ -47,34 +102,7 @@ def connection_status(ctx: click.Context, detailed: bool) -> None:
     log_operation_start("github connection test")
 
     try:
-        # Load configuration
-        config_manager = ConfigManager(ctx.obj.get("config"))
-        config_manager.load_config()
-
-        # Get GitHub credentials
-        credentials = config_manager.get_github_credentials()
-
-        # Create GitHub client
-        github_client = create_github_client(
-            token=(
-                credentials["token"] if isinstance(credentials["token"], str) else None
-            ),
-            username=(
-                credentials["username"]
-                if isinstance(credentials["username"], str)
-                else None
-            ),
-            password=(
-                credentials["password"]
-                if isinstance(credentials["password"], str)
-                else None
-            ),
-            base_url=(
-                str(credentials["base_url"])
-                if credentials["base_url"]
-                else "https://api.github.com"
-            ),
-        )
+        github_client = _get_github_client(ctx)
 
         # Test connection
         if github_client.test_connection():
@@ -189,34 +217,7 @@ def get_repo(ctx: click.Context, repo: str) -> None:
     log_operation_start("github repository fetch", repo=repo)
 
     try:
-        # Load configuration
-        config_manager = ConfigManager(ctx.obj.get("config"))
-        config_manager.load_config()
-
-        # Get GitHub credentials
-        credentials = config_manager.get_github_credentials()
-
-        # Create GitHub client
-        github_client = create_github_client(
-            token=(
-                credentials["token"] if isinstance(credentials["token"], str) else None
-            ),
-            username=(
-                credentials["username"]
-                if isinstance(credentials["username"], str)
-                else None
-            ),
-            password=(
-                credentials["password"]
-                if isinstance(credentials["password"], str)
-                else None
-            ),
-            base_url=(
-                str(credentials["base_url"])
-                if credentials["base_url"]
-                else "https://api.github.com"
-            ),
-        )
+        github_client = _get_github_client(ctx)
 
         # Get repository information
         github_repo = github_client.get_repository(repo)
@@ -283,43 +284,11 @@ def get_issues(
     log_operation_start("github issues fetch", repo=repo, state=state)
 
     try:
-        # Load configuration
-        config_manager = ConfigManager(ctx.obj.get("config"))
-        config_manager.load_config()
-
-        # Get GitHub credentials
-        credentials = config_manager.get_github_credentials()
-
-        # Create GitHub client
-        github_client = create_github_client(
-            token=(
-                credentials["token"] if isinstance(credentials["token"], str) else None
-            ),
-            username=(
-                credentials["username"]
-                if isinstance(credentials["username"], str)
-                else None
-            ),
-            password=(
-                credentials["password"]
-                if isinstance(credentials["password"], str)
-                else None
-            ),
-            base_url=(
-                str(credentials["base_url"])
-                if credentials["base_url"]
-                else "https://api.github.com"
-            ),
-        )
+        github_client = _get_github_client(ctx)
 
         # Parse labels
-        label_list = None
-        if labels:
-            label_list = [label.strip() for label in labels.split(",")]
-
-        exclude_label_list = None
-        if exclude_labels:
-            exclude_label_list = [label.strip() for label in exclude_labels.split(",")]
+        label_list = _parse_labels(labels)
+        exclude_label_list = _parse_labels(exclude_labels)
 
         # Get issues
         issues = github_client.get_issues(
@@ -337,21 +306,20 @@ def get_issues(
             f"📋 Found {len(issues)} issues in {repo}",
         )
 
-        for issue in issues:
-            print_info_panel(
+        print_info_panels(
+            (
                 f"#{issue.number} - {issue.title}",
                 f"State: {issue.state}\n"
-                f"Labels: {', '.join(issue.labels) if issue.labels else 'None'}\n"
-                f"Assignee: {', '.join(issue.assignees) if issue.assignees else 'None'}\n"
+                f"Labels: {issue.labels_display}\n"
+                f"Assignee: {issue.assignees_display}\n"
                 f"Created: {issue.created_at}\n"
                 f"URL: {issue.html_url}",
             )
+            for issue in issues
+        )
 
         # Export if requested
         if export:
-            import json
-            from datetime import datetime
-
             export_data = {
                 "timestamp": datetime.now().isoformat(),
                 "repository": repo,
@@ -378,8 +346,9 @@ def get_issues(
             }
 
             try:
-                with open(export, "w") as f:
-                    json.dump(export_data, f, indent=2)
+                from ..libs.exporter import export_json
+
+                export_json(export_data, export)
                 print_success_panel(f"Issues exported to {export}")
             except Exception as export_error:
                 print_error_panel("Failed to export issues", str(export_error))
@@ -397,6 +366,12 @@ def get_issues(
 @click.option("--exclude-labels", "-e", help="Exclude labels (comma-separated)")
 @click.option("--assignee", "-a", help="Filter by assignee")
 @click.option("--limit", type=int, help="Maximum results to return per repository")
+@click.option(
+    "--max-concurrent",
+    type=int,
+    default=4,
+    help="Maximum repositories fetched concurrently (1 fetches serially)",
+)
 @click.option("--export", help="Export results to JSON file")
 @click.pass_context
 def get_issues_multi(
@@ -407,6 +382,7 @@ def get_issues_multi(
     exclude_labels: Optional[str],
     assignee: Optional[str],
     limit: Optional[int],
+    max_concurrent: int,
     export: Optional[str],
 ) -> None:
     """Get issues from multiple GitHub repositories with advanced filtering.
@@ -416,46 +392,14 @@ def get_issues_multi(
     log_operation_start("github issues fetch multiple repos", repos=repos, state=state)
 
     try:
-        # Load configuration
-        config_manager = ConfigManager(ctx.obj.get("config"))
-        config_manager.load_config()
-
-        # Get GitHub credentials
-        credentials = config_manager.get_github_credentials()
-
-        # Create GitHub client
-        github_client = create_github_client(
-            token=(
-                credentials["token"] if isinstance(credentials["token"], str) else None
-            ),
-            username=(
-                credentials["username"]
-                if isinstance(credentials["username"], str)
-                else None
-            ),
-            password=(
-                credentials["password"]
-                if isinstance(credentials["password"], str)
-                else None
-            ),
-            base_url=(
-                str(credentials["base_url"])
-                if credentials["base_url"]
-                else "https://api.github.com"
-            ),
-        )
+        github_client = _get_github_client(ctx)
 
         # Parse repository list
         repo_list = [repo.strip() for repo in repos.split(",")]
 
         # Parse labels
-        label_list = None
-        if labels:
-            label_list = [label.strip() for label in labels.split(",")]
-
-        exclude_label_list = None
-        if exclude_labels:
-            exclude_label_list = [label.strip() for label in exclude_labels.split(",")]
+        label_list = _parse_labels(labels)
+        exclude_label_list = _parse_labels(exclude_labels)
 
         # Get issues from multiple repositories
         all_issues = github_client.get_issues_for_repositories(
@@ -465,75 +409,58 @@ def get_issues_multi(
             exclude_labels=exclude_label_list,
             assignee=assignee,
             limit_per_repo=limit,
+            max_workers=max_concurrent,
         )
 
-        total_issues = sum(len(issues) for issues in all_issues.values())
-        log_operation_success(
-            "github issues fetch multiple repos", repos=repos, total_count=total_issues
-        )
-        print_success_panel(
-            f"Found {total_issues} issues across {len(repo_list)} repositories",
-            f"📋 Found {total_issues} issues across {len(repo_list)} repositories",
-        )
-
-        # Display results by repository
+        # Count issues and build the per-repository panels in one pass
+        total_issues = 0
+        panels: list[tuple[str, Optional[str]]] = []
         for repo_name, issues in all_issues.items():
             if issues:
-                print_info_panel(
-                    f"Repository: {repo_name}",
-                    f"Found {len(issues)} issues",
+                total_issues += len(issues)
+                panels.append(
+                    (f"Repository: {repo_name}", f"Found {len(issues)} issues")
                 )
-
-                for issue in issues:
-                    print_info_panel(
+                panels.extend(
+                    (
                         f"#{issue.number} - {issue.title}",
                         f"Repository: {repo_name}\n"
                         f"State: {issue.state}\n"
-                        f"Labels: {', '.join(issue.labels) if issue.labels else 'None'}\n"
-                        f"Assignee: {', '.join(issue.assignees) if issue.assignees else 'None'}\n"
+                        f"Labels: {issue.labels_display}\n"
+                        f"Assignee: {issue.assignees_display}\n"
                         f"Created: {issue.created_at}\n"
                         f"URL: {issue.html_url}",
                     )
+                    for issue in issues
+                )
+
+        log_operation_success(
+            "github issues fetch multiple repos", repos=repos, total_count=total_issues
+        )
+        print_success_panel(
+            f"Found {total_issues} issues across {len(repo_list)} repositories",
+            f"📋 Found {total_issues} issues across {len(repo_list)} repositories",
+        )
+
+        # Display results by repository, rendered in a single write
+        print_info_panels(panels)
 
         # Export results if requested
         if export:
-            import json
-            from datetime import datetime
+            from ..libs.exporter import export_issues_by_repository
 
-            export_data = {
-                "timestamp": datetime.now().isoformat(),
-                "repositories": repo_list,
-                "total_issues": total_issues,
-                "filters": {
+            export_issues_by_repository(
+                all_issues,
+                export,
+                repositories=repo_list,
+                filters={
                     "state": state,
                     "labels": label_list,
                     "exclude_labels": exclude_label_list,
                     "assignee": assignee,
                     "limit": limit,
                 },
-                "issues": {
-                    repo_name: [
-                        {
-                            "number": issue.number,
-                            "title": issue.title,
-                            "state": issue.state,
-                            "labels": issue.labels,
-                            "assignees": issue.assignees,
-                            "created_at": issue.created_at,
-                            "html_url": issue.html_url,
-                        }
-                        for issue in issues
-                    ]
-                    for repo_name, issues in all_issues.items()
-                },
-            }
-
-            try:
-                with open(export, "w") as f:
-                    json.dump(export_data, f, indent=2)
-                print_success_panel(f"Issues exported to {export}")
-            except Exception as export_error:
-                print_error_panel("Failed to export issues", str(export_error))
+            )
 
     except Exception as e:
         log_operation_failure("github issues fetch multiple repos", e)
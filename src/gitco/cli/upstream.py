@@ -38,6 +38,27 @@ def register_upstream_commands(main_group):
     main_group.add_command(upstream_group)
 
 
+def _require_valid_repo(
+    git_manager: GitRepositoryManager, repo: str, operation: str
+) -> None:
+    """Exit with a single error panel if ``repo`` is not a valid repository path.
+
+    Args:
+        git_manager: Repository manager used by the command
+        repo: Repository path given with --repo
+        operation: Operation name used when logging the failure
+    """
+    is_valid, errors = git_manager.validate_repository_path(repo)
+    if not is_valid:
+        log_operation_failure(operation, ValidationError("Invalid repository path"))
+        print_error_panel(
+            "Invalid Repository Path",
+            "❌ Invalid repository path:\n"
+            + "\n".join(f"  - {error}" for error in errors),
+        )
+        sys.exit(1)
+
+
 @click.command()
 @click.option("--repo", "-r", required=True, help="Repository name")
 @click.option("--url", required=True, help="Upstream repository URL")
@@ -55,17 +76,7 @@ def add(ctx: click.Context, repo: str, url: str, name: Optional[str]) -> None:
 
     try:
         git_manager = GitRepositoryManager()
-
-        # Validate repository path
-        is_valid, errors = git_manager.validate_repository_path(repo)
-        if not is_valid:
-            log_operation_failure(
-                "upstream remote addition", ValidationError("Invalid repository path")
-            )
-            print_error_panel("Invalid Repository Path", "❌ Invalid repository path:\n")
-            for error in errors:
-                print_error_panel("Error", f"  - {error}")
-            sys.exit(1)
+        _require_valid_repo(git_manager, repo, "upstream remote addition")
 
         # Add upstream remote
         success = git_manager.setup_upstream_remote(repo, url)
@@ -103,17 +114,7 @@ def remove(ctx: click.Context, repo: str) -> None:
 
     try:
         git_manager = GitRepositoryManager()
-
-        # Validate repository path
-        is_valid, errors = git_manager.validate_repository_path(repo)
-        if not is_valid:
-            log_operation_failure(
-                "upstream remote removal", ValidationError("Invalid repository path")
-            )
-            print_error_panel("Invalid Repository Path", "❌ Invalid repository path:\n")
-            for error in errors:
-                print_error_panel("Error", f"  - {error}")
-            sys.exit(1)
+        _require_valid_repo(git_manager, repo, "upstream remote removal")
 
         # Remove upstream remote
         success = git_manager.remove_upstream_remote(repo)
@@ -152,17 +153,7 @@ def update(ctx: click.Context, repo: str, url: str) -> None:
 
     try:
         git_manager = GitRepositoryManager()
-
-        # Validate repository path
-        is_valid, errors = git_manager.validate_repository_path(repo)
-        if not is_valid:
-            log_operation_failure(
-                "upstream remote update", ValidationError("Invalid repository path")
-            )
-            print_error_panel("Invalid Repository Path", "❌ Invalid repository path:\n")
-            for error in errors:
-                print_error_panel("Error", f"  - {error}")
-            sys.exit(1)
+        _require_valid_repo(git_manager, repo, "upstream remote update")
 
         # Update upstream remote
         success = git_manager.update_upstream_remote(repo, url)
@@ -202,17 +193,7 @@ def validate(ctx: click.Context, repo: str, detailed: bool) -> None:
 
     try:
         git_manager = GitRepositoryManager()
-
-        # Validate repository path
-        is_valid, errors = git_manager.validate_repository_path(repo)
-        if not is_valid:
-            log_operation_failure(
-                "upstream remote validation", ValidationError("Invalid repository path")
-            )
-            print_error_panel("Invalid Repository Path", "❌ Invalid repository path:\n")
-            for error in errors:
-                print_error_panel("Error", f"  - {error}")
-            sys.exit(1)
+        _require_valid_repo(git_manager, repo, "upstream remote validation")
 
         # Validate upstream remote
         validation = git_manager.validate_upstream_remote(repo)
@@ -262,17 +243,7 @@ def fetch(ctx: click.Context, repo: str) -> None:
 
     try:
         git_manager = GitRepositoryManager()
-
-        # Validate repository path
-        is_valid, errors = git_manager.validate_repository_path(repo)
-        if not is_valid:
-            log_operation_failure(
-                "upstream fetch", ValidationError("Invalid repository path")
-            )
-            print_error_panel("Invalid Repository Path", "❌ Invalid repository path:\n")
-            for error in errors:
-                print_error_panel("Error", f"  - {error}")
-            sys.exit(1)
+        _require_valid_repo(git_manager, repo, "upstream fetch")
 
         # Get repository instance
         repository = git_manager.get_repository_info(repo)
@@ -338,17 +309,7 @@ def merge(
 
     try:
         git_manager = GitRepositoryManager()
-
-        # Validate repository path
-        is_valid, errors = git_manager.validate_repository_path(repo)
-        if not is_valid:
-            log_operation_failure(
-                "upstream merge", ValidationError("Invalid repository path")
-            )
-            print_error_panel("Invalid Repository Path", "❌ Invalid repository path:\n")
-            for error in errors:
-                print_error_panel("Error", f"  - {error}")
-            sys.exit(1)
+        _require_valid_repo(git_manager, repo, "upstream merge")
 
         # Get repository instance
         repository = git_manager.get_repository_info(repo)
@@ -402,13 +363,13 @@ def merge(
                 f"Repository: {repo}\nBranch: {merge_branch}\nStrategy: {strategy}",
             )
         elif merge_result.get("conflicts"):
+            conflicts = merge_result["conflicts"]
             print_info_panel(
                 "Merge conflicts detected",
-                f"Conflicts detected in {len(merge_result['conflicts'])} files.\n"
-                f"Please resolve conflicts manually and commit.",
+                f"Conflicts detected in {len(conflicts)} files.\n"
+                f"Please resolve conflicts manually and commit.\n\n"
+                + "\n".join(f"  - {conflict}" for conflict in conflicts),
             )
-            for conflict in merge_result["conflicts"]:
-                print_info_panel("Conflict", f"  - {conflict}")
         else:
             log_operation_failure(
                 "upstream merge", Exception("Failed to merge upstream changes")
@@ -1,6 +1,8 @@
 """Repository activity dashboard for GitCo."""
 
+import heapq
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Optional
 
 from ..utils.common import get_logger
@@ -154,19 +156,17 @@ class ActivityDashboard:
 
         summary.total_repositories = len(all_metrics)
 
-        # Calculate summary statistics
+        # Calculate summary statistics and score totals in one pass
+        activity_total = 0.0
+        engagement_total = 0.0
         for metrics in all_metrics:
             self._update_summary_counters(summary, metrics)
+            activity_total += metrics.activity_score
+            engagement_total += metrics.engagement_score
 
         # Calculate averages
-        if summary.total_repositories > 0:
-            summary.average_activity_score = (
-                sum(m.activity_score for m in all_metrics) / summary.total_repositories
-            )
-            summary.average_engagement_score = (
-                sum(m.engagement_score for m in all_metrics)
-                / summary.total_repositories
-            )
+        summary.average_activity_score = activity_total / summary.total_repositories
+        summary.average_engagement_score = engagement_total / summary.total_repositories
 
         # Identify trending and declining repositories
         summary.trending_repositories = self._identify_trending_repositories(
@@ -390,11 +390,11 @@ class ActivityDashboard:
     ) -> list[str]:
         """Identify trending repositories based on activity growth."""
         try:
-            # Sort by activity score and return top 5
-            sorted_metrics = sorted(
-                all_metrics, key=lambda x: x.activity_score, reverse=True
+            # Top 5 by activity score
+            top_metrics = heapq.nlargest(
+                5, all_metrics, key=attrgetter("activity_score")
             )
-            return [m.repository_name for m in sorted_metrics[:5]]
+            return [m.repository_name for m in top_metrics]
         except Exception as e:
             self.logger.warning(f"Failed to identify trending repositories: {e}")
             return []
@@ -404,9 +404,11 @@ class ActivityDashboard:
     ) -> list[str]:
         """Identify declining repositories based on low activity."""
         try:
-            # Sort by activity score and return bottom 5
-            sorted_metrics = sorted(all_metrics, key=lambda x: x.activity_score)
-            return [m.repository_name for m in sorted_metrics[:5]]
+            # Bottom 5 by activity score
+            bottom_metrics = heapq.nsmallest(
+                5, all_metrics, key=attrgetter("activity_score")
+            )
+            return [m.repository_name for m in bottom_metrics]
         except Exception as e:
             self.logger.warning(f"Failed to identify declining repositories: {e}")
             return []
@@ -416,11 +418,11 @@ class ActivityDashboard:
     ) -> list[str]:
         """Identify most active repositories."""
         try:
-            # Sort by commits in last 7 days
-            sorted_metrics = sorted(
-                all_metrics, key=lambda x: x.commits_last_7d, reverse=True
+            # Top 5 by commits in last 7 days
+            top_metrics = heapq.nlargest(
+                5, all_metrics, key=attrgetter("commits_last_7d")
             )
-            return [m.repository_name for m in sorted_metrics[:5]]
+            return [m.repository_name for m in top_metrics]
         except Exception as e:
             self.logger.warning(f"Failed to identify most active repositories: {e}")
             return []
@@ -430,11 +432,11 @@ class ActivityDashboard:
     ) -> list[str]:
         """Identify most engaged repositories."""
         try:
-            # Sort by engagement score
-            sorted_metrics = sorted(
-                all_metrics, key=lambda x: x.engagement_score, reverse=True
+            # Top 5 by engagement score
+            top_metrics = heapq.nlargest(
+                5, all_metrics, key=attrgetter("engagement_score")
             )
-            return [m.repository_name for m in sorted_metrics[:5]]
+            return [m.repository_name for m in top_metrics]
         except Exception as e:
             self.logger.warning(f"Failed to identify most engaged repositories: {e}")
             return []
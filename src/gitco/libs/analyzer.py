@@ -1,15 +1,23 @@
 """AI-powered change analysis for GitCo."""
 
+import hashlib
+import json
 import os
+import re
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from functools import cache, lru_cache
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Optional
 
-import anthropic
-import openai
 import requests
 from rich.panel import Panel
 
+from .. import __version__
 from ..utils.common import (
     console,
     get_logger,
@@ -38,6 +46,137 @@ from .detector import (
 from .git_ops import GitRepository
 from .prompts import PromptManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import anthropic
+    import openai
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# LLM responses keyed by a digest of (API, model, system prompt, prompt), shared
+# by every analyzer in the process so identical requests skip the network call
+_RESPONSE_CACHE: dict[str, tuple[float, str]] = {}
+_RESPONSE_CACHE_LOCK = Lock()
+_RESPONSE_CACHE_TTL = 3600.0
+_RESPONSE_CACHE_MAX_SIZE = 128
+
+# Model each built-in provider's analyzer uses; custom endpoints use "default"
+_PROVIDER_MODELS = {
+    "openai": "gpt-3.5-turbo",
+    "anthropic": "claude-3-sonnet-20240229",
+}
+_CUSTOM_MODEL = "default"
+
+# Analyses stored on disk by ChangeAnalyzer, capped by age and count
+_ANALYSIS_CACHE_TTL = 7 * 24 * 3600.0
+_ANALYSIS_CACHE_MAX_ENTRIES = 256
+
+# Summaries of the placeholder analyses returned when the reply was unusable;
+# these are never written to the analysis cache
+_PARSE_FAILED_SUMMARY = "Analysis completed (parsing failed)"
+_NO_SUMMARY = "No summary provided"
+_FALLBACK_SUMMARIES = frozenset({_PARSE_FAILED_SUMMARY, _NO_SUMMARY})
+
+# Response parsing: the outermost {...} block, then the sections of a plain-text
+# answer ("Summary: ...", "Breaking Changes: - ...") when it isn't JSON
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+_SUMMARY_RE = re.compile(
+    r"Summary:\s*(.+?)(?=\n\n|\n[A-Z]|$)", re.DOTALL | re.IGNORECASE
+)
+_LIST_SECTION_RES = tuple(
+    (key, re.compile(rf"{label}:\s*(.+?)(?=\n\n|\n[A-Z]|$)", re.DOTALL | re.IGNORECASE))
+    for key, label in (
+        ("breaking_changes", "Breaking Changes?"),
+        ("new_features", "New Features?"),
+        ("bug_fixes", "Bug Fixes?"),
+        ("security_updates", "Security Updates?"),
+        ("deprecations", "Deprecations?"),
+        ("recommendations", "Recommendations?"),
+    )
+)
+_CONFIDENCE_RE = re.compile(r"Confidence:\s*(\d+\.?\d*)", re.IGNORECASE)
+
+# Commit categories in priority order, each matched by one keyword alternation
+# against the lowercased message; messages matching none count as "other"
+_COMMIT_CATEGORY_PATTERNS = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in (
+        ("breaking", ("breaking", "!")),
+        ("security", ("security", "vulnerability", "cve")),
+        ("feature", ("feat:", "feature:", "add:", "new:")),
+        ("fix", ("fix:", "bug:", "issue:")),
+        ("docs", ("docs:", "documentation:", "readme:")),
+        ("style", ("style:", "format:", "lint:")),
+        ("refactor", ("refactor:", "refactoring:")),
+        ("test", ("test:", "testing:", "spec:")),
+        ("chore", ("chore:", "maintenance:", "deps:")),
+    )
+)
+
+
+@cache
+def _get_breaking_detector() -> BreakingChangeDetector:
+    """Get the shared breaking change detector; detectors hold no per-call state.
+
+    Returns:
+        Breaking change detector.
+    """
+    return BreakingChangeDetector()
+
+
+@cache
+def _get_security_deprecation_detector() -> SecurityDeprecationDetector:
+    """Get the shared security and deprecation detector.
+
+    Returns:
+        Security and deprecation detector.
+    """
+    return SecurityDeprecationDetector()
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(
+    api_key: str, base_url: Optional[str], timeout: int
+) -> "openai.OpenAI":
+    """Get a shared OpenAI client so analyzers reuse its pooled connections.
+
+    Args:
+        api_key: OpenAI API key.
+        base_url: Custom base URL for OpenAI API.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        OpenAI client for these settings.
+    """
+    # Imported on first use so runs that never call OpenAI skip loading the SDK
+    import openai
+
+    return openai.OpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
+
+
+@lru_cache(maxsize=8)
+def _get_anthropic_client(
+    api_key: str, base_url: Optional[str]
+) -> "anthropic.Anthropic":
+    """Get a shared Anthropic client so analyzers reuse its pooled connections.
+
+    Args:
+        api_key: Anthropic API key.
+        base_url: Custom base URL for Anthropic API.
+
+    Returns:
+        Anthropic client for these settings.
+    """
+    # Imported on first use so runs that never call Anthropic skip loading the SDK
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key, base_url=base_url)
+
 
 @dataclass
 class ChangeAnalysis:
@@ -83,8 +222,8 @@ class BaseAnalyzer(ABC):
         """
         self.model = model
         self.logger = get_logger()
-        self.breaking_detector = BreakingChangeDetector()
-        self.security_deprecation_detector = SecurityDeprecationDetector()
+        self.breaking_detector = _get_breaking_detector()
+        self.security_deprecation_detector = _get_security_deprecation_detector()
         self.prompt_manager = PromptManager()
         self.cost_optimizer = get_cost_optimizer()
 
@@ -113,6 +252,42 @@ class BaseAnalyzer(ABC):
         api_name: str = "OpenAI"
         return api_name
 
+    def _get_llm_response(self, prompt: str, system_prompt: str) -> str:
+        """Call the LLM API, reusing a recent response to an identical request.
+
+        Args:
+            prompt: The user prompt to send to the LLM.
+            system_prompt: The system prompt to send to the LLM.
+
+        Returns:
+            The raw response from the LLM.
+        """
+        key = hashlib.sha256(
+            json.dumps(
+                [self._get_api_name(), self.model, system_prompt, prompt]
+            ).encode()
+        ).hexdigest()
+        now = time.monotonic()
+
+        with _RESPONSE_CACHE_LOCK:
+            cached = _RESPONSE_CACHE.get(key)
+        if cached is not None and now - cached[0] < _RESPONSE_CACHE_TTL:
+            self.logger.debug(f"Reusing cached {self._get_api_name()} response")
+            return cached[1]
+
+        response = self._call_llm_api(prompt, system_prompt)
+
+        # Empty responses are usually transient failures; don't pin them
+        if response:
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE.pop(key, None)
+                if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX_SIZE:
+                    # Dicts keep insertion order, so the first key is the oldest
+                    del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+                _RESPONSE_CACHE[key] = (now, response)
+
+        return response
+
     def analyze_changes(self, request: AnalysisRequest) -> ChangeAnalysis:
         """Analyze changes using AI.
 
@@ -152,8 +327,8 @@ class BaseAnalyzer(ABC):
             # Get system prompt
             system_prompt = self._get_system_prompt()
 
-            # Call LLM API
-            response = self._call_llm_api(prompt, system_prompt)
+            # Call LLM API, unless an identical request was answered recently
+            response = self._get_llm_response(prompt, system_prompt)
 
             # Parse response
             analysis = self._parse_analysis_response(response)
@@ -258,7 +433,7 @@ Always respond with valid JSON as specified in the user prompt."""
             parsed = self._parse_text_response(response)
 
             return ChangeAnalysis(
-                summary=parsed.get("summary", "No summary provided"),
+                summary=parsed.get("summary", _NO_SUMMARY),
                 breaking_changes=parsed.get("breaking_changes", []),
                 new_features=parsed.get("new_features", []),
                 bug_fixes=parsed.get("bug_fixes", []),
@@ -271,7 +446,7 @@ Always respond with valid JSON as specified in the user prompt."""
             self.logger.warning(f"Failed to parse LLM response: {e}")
             # Return a basic analysis
             return ChangeAnalysis(
-                summary="Analysis completed (parsing failed)",
+                summary=_PARSE_FAILED_SUMMARY,
                 breaking_changes=[],
                 new_features=[],
                 bug_fixes=[],
@@ -290,21 +465,18 @@ Always respond with valid JSON as specified in the user prompt."""
         Returns:
             Parsed response as dictionary.
         """
-        import json
-        import re
-
         # Try to extract JSON from the response
-        json_match = re.search(r"\{.*\}", response, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(response)
         if json_match:
             try:
-                json_result: dict[str, Any] = json.loads(json_match.group())
+                json_result: dict[str, Any] = _json_loads(json_match.group())
                 return json_result
             except json.JSONDecodeError:
                 pass
 
         # If JSON extraction fails, try to parse the entire response
         try:
-            parse_result: dict[str, Any] = json.loads(response)
+            parse_result: dict[str, Any] = _json_loads(response)
             return parse_result
         except json.JSONDecodeError:
             # Parse text format with sections
@@ -320,104 +492,23 @@ Always respond with valid JSON as specified in the user prompt."""
             }
 
             # Extract summary
-            summary_match = re.search(
-                r"Summary:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
+            summary_match = _SUMMARY_RE.search(response)
             if summary_match:
                 result["summary"] = summary_match.group(1).strip()
 
-            # Extract breaking changes
-            breaking_match = re.search(
-                r"Breaking Changes?:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if breaking_match:
-                breaking_text = breaking_match.group(1).strip()
-                result["breaking_changes"] = [
-                    line.strip()[2:]
-                    for line in breaking_text.split("\n")
-                    if line.strip().startswith("-")
-                ]
-
-            # Extract new features
-            features_match = re.search(
-                r"New Features?:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if features_match:
-                features_text = features_match.group(1).strip()
-                result["new_features"] = [
-                    line.strip()[2:]
-                    for line in features_text.split("\n")
-                    if line.strip().startswith("-")
-                ]
-
-            # Extract bug fixes
-            bugs_match = re.search(
-                r"Bug Fixes?:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if bugs_match:
-                bugs_text = bugs_match.group(1).strip()
-                result["bug_fixes"] = [
-                    line.strip()[2:]
-                    for line in bugs_text.split("\n")
-                    if line.strip().startswith("-")
-                ]
-
-            # Extract security updates
-            security_match = re.search(
-                r"Security Updates?:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if security_match:
-                security_text = security_match.group(1).strip()
-                result["security_updates"] = [
-                    line.strip()[2:]
-                    for line in security_text.split("\n")
-                    if line.strip().startswith("-")
-                ]
-
-            # Extract deprecations
-            deprecations_match = re.search(
-                r"Deprecations?:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if deprecations_match:
-                deprecations_text = deprecations_match.group(1).strip()
-                result["deprecations"] = [
-                    line.strip()[2:]
-                    for line in deprecations_text.split("\n")
-                    if line.strip().startswith("-")
-                ]
-
-            # Extract recommendations
-            recommendations_match = re.search(
-                r"Recommendations?:\s*(.+?)(?=\n\n|\n[A-Z]|$)",
-                response,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if recommendations_match:
-                recommendations_text = recommendations_match.group(1).strip()
-                result["recommendations"] = [
-                    line.strip()[2:]
-                    for line in recommendations_text.split("\n")
-                    if line.strip().startswith("-")
-                ]
+            # Extract the bulleted sections
+            for key, section_re in _LIST_SECTION_RES:
+                section_match = section_re.search(response)
+                if section_match:
+                    section_text = section_match.group(1).strip()
+                    result[key] = [
+                        line.strip()[2:]
+                        for line in section_text.split("\n")
+                        if line.strip().startswith("-")
+                    ]
 
             # Extract confidence
-            confidence_match = re.search(
-                r"Confidence:\s*(\d+\.?\d*)",
-                response,
-                re.IGNORECASE,
-            )
+            confidence_match = _CONFIDENCE_RE.search(response)
             if confidence_match:
                 try:
                     result["confidence"] = float(confidence_match.group(1))
@@ -466,12 +557,8 @@ class OpenAIAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
         self.connect_timeout = connect_timeout or timeout
         self.read_timeout = read_timeout or timeout
 
-        # Initialize OpenAI client with timeout configuration
-        self.client = openai.OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url,
-            timeout=timeout,
-        )
+        # Share one OpenAI client (and its connection pool) per configuration
+        self.client = _get_openai_client(self.api_key, self.base_url, timeout)
 
     @with_retry(config=TIMEOUT_AWARE_RETRY_CONFIG)
     def _call_llm_api(self, prompt: str, system_prompt: str) -> str:
@@ -603,10 +690,8 @@ class AnthropicAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
         self.connect_timeout = connect_timeout or timeout
         self.read_timeout = read_timeout or timeout
 
-        self.client = anthropic.Anthropic(
-            api_key=self.api_key,
-            base_url=self.base_url,
-        )
+        # Share one Anthropic client (and its connection pool) per configuration
+        self.client = _get_anthropic_client(self.api_key, self.base_url)
 
     @with_retry(config=TIMEOUT_AWARE_RETRY_CONFIG)
     def _call_llm_api(self, prompt: str, system_prompt: str) -> str:
@@ -874,8 +959,10 @@ class ChangeAnalyzer:
         self.config = config
         self.logger = get_logger()
         self.analyzers: dict[str, BaseAnalyzer] = {}
-        self.breaking_change_detector = BreakingChangeDetector()
-        self.security_deprecation_detector = SecurityDeprecationDetector()
+        self._analyzers_lock = Lock()
+        self.analysis_cache_dir = Path("~/.gitco/analysis_cache").expanduser()
+        self.breaking_change_detector = _get_breaking_detector()
+        self.security_deprecation_detector = _get_security_deprecation_detector()
 
     def get_analyzer(self, provider: str = "openai") -> BaseAnalyzer:
         """Get analyzer for the specified provider.
@@ -889,44 +976,83 @@ class ChangeAnalyzer:
         Raises:
             ValueError: If provider is not supported.
         """
-        if provider in self.analyzers:
-            return self.analyzers[provider]
+        analyzer = self.analyzers.get(provider)
+        if analyzer is not None:
+            return analyzer
+
+        # Batch analysis calls this from worker threads; build each provider's
+        # analyzer once rather than once per racing worker
+        with self._analyzers_lock:
+            analyzer = self.analyzers.get(provider)
+            if analyzer is None:
+                analyzer = self._build_analyzer(provider)
+                self.analyzers[provider] = analyzer
+            return analyzer
+
+    def prewarm(self, provider: Optional[str] = None) -> None:
+        """Build the provider's analyzer on a background thread.
+
+        Loading a provider SDK and creating its client takes around half a
+        second, so callers start this before unrelated work (such as syncing)
+        and the first analysis finds the analyzer ready. Failures are left
+        for the analysis itself to report.
+
+        Args:
+            provider: LLM provider to prepare (defaults to the configured one).
+        """
+        analyzer_provider = provider or self.config.settings.llm_provider
+
+        def build() -> None:
+            try:
+                self.get_analyzer(analyzer_provider)
+            except Exception as e:
+                self.logger.debug(
+                    f"Prewarming {analyzer_provider} analyzer failed: {e}"
+                )
+
+        Thread(target=build, name="gitco-prewarm", daemon=True).start()
+
+    def _build_analyzer(self, provider: str) -> BaseAnalyzer:
+        """Build a new analyzer for the specified provider.
+
+        Args:
+            provider: Provider name (openai, anthropic, custom).
+
+        Returns:
+            Configured analyzer instance.
 
+        Raises:
+            ValueError: If provider is not supported.
+        """
         if provider == "openai":
-            openai_analyzer: BaseAnalyzer = OpenAIAnalyzer(
+            return OpenAIAnalyzer(
                 api_key=os.getenv("OPENAI_API_KEY"),
-                model="gpt-3.5-turbo",
+                model=_PROVIDER_MODELS["openai"],
                 base_url=self.config.settings.llm_openai_api_url,
                 timeout=30,
                 connect_timeout=None,
                 read_timeout=None,
             )
-            self.analyzers[provider] = openai_analyzer
-            return openai_analyzer
         elif provider == "anthropic":
-            anthropic_analyzer: BaseAnalyzer = AnthropicAnalyzer(
+            return AnthropicAnalyzer(
                 api_key=os.getenv("ANTHROPIC_API_KEY"),
-                model="claude-3-sonnet-20240229",
+                model=_PROVIDER_MODELS["anthropic"],
                 base_url=self.config.settings.llm_anthropic_api_url,
                 timeout=30,
                 connect_timeout=None,
                 read_timeout=None,
             )
-            self.analyzers[provider] = anthropic_analyzer
-            return anthropic_analyzer
         elif is_custom_provider(provider, self.config):
             endpoint_url, api_key = get_custom_endpoint_config(self.config, provider)
-            custom_analyzer: BaseAnalyzer = CustomAnalyzer(
+            return CustomAnalyzer(
                 api_key=api_key,
-                model="default",
+                model=_CUSTOM_MODEL,
                 endpoint_url=endpoint_url,
                 provider_name=provider,
                 timeout=30,
                 connect_timeout=None,
                 read_timeout=None,
             )
-            self.analyzers[provider] = custom_analyzer
-            return custom_analyzer
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
 
@@ -936,6 +1062,7 @@ class ChangeAnalyzer:
         git_repo: GitRepository,
         custom_prompt: Optional[str] = None,
         provider: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Optional[ChangeAnalysis]:
         """Analyze changes in a repository.
 
@@ -944,6 +1071,8 @@ class ChangeAnalyzer:
             git_repo: Git repository instance.
             custom_prompt: Custom prompt for analysis.
             provider: LLM provider to use.
+            use_cache: Reuse a stored analysis of identical changes instead of
+                calling the LLM again.
 
         Returns:
             Analysis result or None if analysis fails.
@@ -966,19 +1095,194 @@ class ChangeAnalyzer:
                 custom_prompt=custom_prompt,
             )
 
-            # Get analyzer
-            analyzer_provider = provider or self.config.settings.llm_provider
-            analyzer = self.get_analyzer(analyzer_provider)
-
-            # Perform analysis
-            analysis = analyzer.analyze_changes(request)
-
-            return analysis
+            return self._run_analysis(request, provider, use_cache)
 
         except Exception as e:
             self.logger.error(f"Failed to analyze changes for {repository.name}: {e}")
             return None
 
+    def _run_analysis(
+        self, request: AnalysisRequest, provider: Optional[str], use_cache: bool
+    ) -> ChangeAnalysis:
+        """Analyze a request, reusing a stored analysis of identical changes.
+
+        Args:
+            request: Analysis request.
+            provider: LLM provider to use (defaults to the configured one).
+            use_cache: Reuse a stored analysis instead of calling the LLM again.
+
+        Returns:
+            Analysis result.
+        """
+        analyzer_provider = provider or self.config.settings.llm_provider
+
+        # Identical changes analyzed before need no LLM call at all, nor the
+        # provider SDK, client or API key
+        cache_path = self._analysis_cache_path(analyzer_provider, request)
+        if use_cache:
+            cached = self._load_cached_analysis(cache_path)
+            if cached is not None:
+                self.logger.info(f"Using cached analysis for {request.repository.name}")
+                return cached
+
+        analyzer = self.get_analyzer(analyzer_provider)
+        analysis = analyzer.analyze_changes(request)
+        self._save_cached_analysis(cache_path, analysis)
+        return analysis
+
+    def _analysis_cache_path(self, provider: str, request: AnalysisRequest) -> Path:
+        """Get the cache file for an analysis of these exact inputs.
+
+        The key is built from the configuration alone, so a stored analysis
+        can be found without constructing the provider's analyzer.
+
+        Args:
+            provider: Provider that would run the analysis.
+            request: Analysis request.
+
+        Returns:
+            Path of the cache file, named by a digest of everything the
+            analysis depends on.
+        """
+        settings = self.config.settings
+        if provider == "openai":
+            endpoint = settings.llm_openai_api_url
+        elif provider == "anthropic":
+            endpoint = settings.llm_anthropic_api_url
+        else:
+            endpoint = (settings.llm_custom_endpoints or {}).get(provider)
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    __version__,
+                    provider,
+                    _PROVIDER_MODELS.get(provider, _CUSTOM_MODEL),
+                    endpoint,
+                    request.repository.name,
+                    request.repository.local_path,
+                    request.diff_content,
+                    request.commit_messages,
+                    request.custom_prompt,
+                ]
+            ).encode()
+        ).hexdigest()
+        return self.analysis_cache_dir / f"{key}.json"
+
+    def _load_cached_analysis(self, cache_path: Path) -> Optional[ChangeAnalysis]:
+        """Load a cached analysis.
+
+        Args:
+            cache_path: Cache file to read.
+
+        Returns:
+            The cached analysis, or None if it is missing, expired or
+            unreadable.
+        """
+        try:
+            if time.time() - cache_path.stat().st_mtime > _ANALYSIS_CACHE_TTL:
+                return None
+            with open(cache_path, "rb") as f:
+                data = _json_loads(f.read())
+            for field, detail_type in (
+                ("detailed_breaking_changes", BreakingChange),
+                ("detailed_security_updates", SecurityUpdate),
+                ("detailed_deprecations", Deprecation),
+            ):
+                if data.get(field) is not None:
+                    data[field] = [detail_type(**item) for item in data[field]]
+            return ChangeAnalysis(**data)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+
+    def _save_cached_analysis(self, cache_path: Path, analysis: ChangeAnalysis) -> None:
+        """Store an analysis for reuse; failures only cost a future LLM call.
+
+        Args:
+            cache_path: Cache file to write.
+            analysis: Analysis to store.
+        """
+        # A placeholder for an unusable reply must not outlive that reply
+        if analysis.summary in _FALLBACK_SUMMARIES:
+            return
+
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(analysis), f, allow_nan=False)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not cache analysis: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        self._prune_analysis_cache()
+
+    def _prune_analysis_cache(self) -> None:
+        """Drop expired analyses and the oldest ones beyond the size cap."""
+        try:
+            entries = []
+            for entry in os.scandir(self.analysis_cache_dir):
+                if entry.name.endswith(".json"):
+                    entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            return
+
+        entries.sort(reverse=True)
+        cutoff = time.time() - _ANALYSIS_CACHE_TTL
+        for index, (mtime, path) in enumerate(entries):
+            if index >= _ANALYSIS_CACHE_MAX_ENTRIES or mtime < cutoff:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def analyze_repositories_batch(
+        self,
+        repositories: list[tuple[Repository, GitRepository]],
+        custom_prompt: Optional[str] = None,
+        provider: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> list[Optional[ChangeAnalysis]]:
+        """Analyze changes in several repositories concurrently.
+
+        Each analysis spends most of its time waiting on the LLM provider, so
+        repositories are analyzed on a thread pool; the provider's rate limiter
+        still paces the requests.
+
+        Args:
+            repositories: (repository configuration, git repository) pairs.
+            custom_prompt: Custom prompt for analysis.
+            provider: LLM provider to use.
+            max_workers: Maximum concurrent analyses (defaults to one per
+                repository).
+            use_cache: Reuse stored analyses of identical changes.
+
+        Returns:
+            Analysis results in input order; None where analysis fails or
+            there are no changes.
+        """
+        workers = min(32, max_workers or len(repositories))
+        executor_context = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gitco-analyze")
+            if workers > 1
+            else nullcontext()
+        )
+        with executor_context as executor:
+            mapper = executor.map if executor is not None else map
+            return list(
+                mapper(
+                    lambda pair: self.analyze_repository_changes(
+                        pair[0], pair[1], custom_prompt, provider, use_cache
+                    ),
+                    repositories,
+                )
+            )
+
     def analyze_specific_commit(
         self,
         repository: Repository,
@@ -986,6 +1290,7 @@ class ChangeAnalyzer:
         commit_hash: str,
         custom_prompt: Optional[str] = None,
         provider: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Optional[ChangeAnalysis]:
         """Analyze a specific commit.
 
@@ -995,6 +1300,8 @@ class ChangeAnalyzer:
             commit_hash: Hash of the commit to analyze.
             custom_prompt: Custom prompt for analysis.
             provider: LLM provider to use.
+            use_cache: Reuse a stored analysis of the same commit instead of
+                calling the LLM again.
 
         Returns:
             Analysis result or None if analysis fails.
@@ -1018,14 +1325,7 @@ class ChangeAnalyzer:
                 custom_prompt=custom_prompt,
             )
 
-            # Get analyzer
-            analyzer_provider = provider or self.config.settings.llm_provider
-            analyzer = self.get_analyzer(analyzer_provider)
-
-            # Perform analysis
-            analysis = analyzer.analyze_changes(request)
-
-            return analysis
+            return self._run_analysis(request, provider, use_cache)
 
         except Exception as e:
             self.logger.error(f"Failed to analyze commit {commit_hash}: {e}")
@@ -1085,75 +1385,33 @@ class ChangeAnalyzer:
         Returns:
             Dictionary mapping categories to counts.
         """
-        categories = {
-            "feature": 0,
-            "fix": 0,
-            "docs": 0,
-            "style": 0,
-            "refactor": 0,
-            "test": 0,
-            "chore": 0,
-            "breaking": 0,
-            "security": 0,
-            "other": 0,
-        }
+        categories = dict.fromkeys(
+            (
+                "feature",
+                "fix",
+                "docs",
+                "style",
+                "refactor",
+                "test",
+                "chore",
+                "breaking",
+                "security",
+                "other",
+            ),
+            0,
+        )
 
         for message in commit_messages:
             message_lower = message.lower()
-
-            # Check for breaking changes
-            if any(
-                keyword in message_lower
-                for keyword in ["breaking", "breaking change", "!"]
-            ):
-                categories["breaking"] += 1
-            # Check for security updates
-            elif any(
-                keyword in message_lower
-                for keyword in ["security", "vulnerability", "cve"]
-            ):
-                categories["security"] += 1
-            # Check for features
-            elif any(
-                keyword in message_lower
-                for keyword in ["feat:", "feature:", "add:", "new:"]
-            ):
-                categories["feature"] += 1
-            # Check for fixes
-            elif any(
-                keyword in message_lower for keyword in ["fix:", "bug:", "issue:"]
-            ):
-                categories["fix"] += 1
-            # Check for documentation
-            elif any(
-                keyword in message_lower
-                for keyword in ["docs:", "documentation:", "readme:"]
-            ):
-                categories["docs"] += 1
-            # Check for style changes
-            elif any(
-                keyword in message_lower for keyword in ["style:", "format:", "lint:"]
-            ):
-                categories["style"] += 1
-            # Check for refactoring
-            elif any(
-                keyword in message_lower for keyword in ["refactor:", "refactoring:"]
-            ):
-                categories["refactor"] += 1
-            # Check for tests
-            elif any(
-                keyword in message_lower for keyword in ["test:", "testing:", "spec:"]
-            ):
-                categories["test"] += 1
-            # Check for chores
-            elif any(
-                keyword in message_lower
-                for keyword in ["chore:", "maintenance:", "deps:"]
-            ):
-                categories["chore"] += 1
-            # If no category matches, count as other
-            else:
-                categories["other"] += 1
+            category = next(
+                (
+                    name
+                    for name, pattern in _COMMIT_CATEGORY_PATTERNS
+                    if pattern.search(message_lower)
+                ),
+                "other",
+            )
+            categories[category] += 1
 
         return categories
 
@@ -1171,26 +1429,19 @@ class ChangeAnalyzer:
 
         analysis = []
 
-        # Count additions and deletions more accurately
-        # Count lines that start with + (but not +++ which are diff headers)
+        # One pass over the lines counts additions and deletions (lines that
+        # start with + or -, but not the +++/--- file headers) and collects
+        # the unique Python files named in "diff --git" headers
         additions = 0
         deletions = 0
-        for line in diff_content.split("\n"):
-            if line.startswith("+") and not line.startswith("+++"):
-                additions += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deletions += 1
-
-        analysis.append(f"Lines: +{additions} -{deletions}")
-
-        # Count files changed
-        file_count = diff_content.count("diff --git")
-        if file_count > 0:
-            analysis.append(f"Files changed: {file_count}")
-
-        # Check for file types - count unique Python files
         py_files = set()
         for line in diff_content.split("\n"):
+            if line.startswith("+"):
+                if not line.startswith("+++"):
+                    additions += 1
+            elif line.startswith("-"):
+                if not line.startswith("---"):
+                    deletions += 1
             if "diff --git" in line and ".py" in line:
                 # Extract filename from diff line like "diff --git a/src/file1.py b/src/file1.py"
                 parts = line.split()
@@ -1199,6 +1450,13 @@ class ChangeAnalyzer:
                     if filename.endswith(".py"):
                         py_files.add(filename)
 
+        analysis.append(f"Lines: +{additions} -{deletions}")
+
+        # Count files changed
+        file_count = diff_content.count("diff --git")
+        if file_count > 0:
+            analysis.append(f"Files changed: {file_count}")
+
         py_count = len(py_files)
         if py_count > 0:
             analysis.append(f"py ({py_count})")
@@ -1302,9 +1560,7 @@ class ChangeAnalyzer:
         confidence_color = (
             "green"
             if analysis.confidence > 0.7
-            else "yellow"
-            if analysis.confidence > 0.4
-            else "red"
+            else "yellow" if analysis.confidence > 0.4 else "red"
         )
         confidence_panel = Panel(
             f"Confidence: {analysis.confidence:.1%}",
@@ -1326,8 +1582,9 @@ class ChangeAnalyzer:
             List of detected breaking changes.
         """
         try:
-            detector = BreakingChangeDetector()
-            return detector.detect_breaking_changes(diff_content, commit_messages)
+            return self.breaking_change_detector.detect_breaking_changes(
+                diff_content, commit_messages
+            )
         except Exception as e:
             self.logger.error(f"Failed to detect breaking changes: {e}")
             return []
@@ -1345,8 +1602,9 @@ class ChangeAnalyzer:
             List of detected security updates.
         """
         try:
-            detector = SecurityDeprecationDetector()
-            return detector.detect_security_updates(diff_content, commit_messages)
+            return self.security_deprecation_detector.detect_security_updates(
+                diff_content, commit_messages
+            )
         except Exception as e:
             self.logger.error(f"Failed to detect security updates: {e}")
             return []
@@ -1364,8 +1622,9 @@ class ChangeAnalyzer:
             List of detected deprecations.
         """
         try:
-            detector = SecurityDeprecationDetector()
-            return detector.detect_deprecations(diff_content, commit_messages)
+            return self.security_deprecation_detector.detect_deprecations(
+                diff_content, commit_messages
+            )
         except Exception as e:
             self.logger.error(f"Failed to detect deprecations: {e}")
             return []
@@ -1496,8 +1755,8 @@ class ChangeAnalyzer:
             return {
                 "changes": [bc.description for bc in breaking_changes],
                 "count": len(breaking_changes),
-                "high_priority_count": len(
-                    [bc for bc in breaking_changes if bc.severity == "high"]
+                "high_priority_count": sum(
+                    1 for bc in breaking_changes if bc.severity == "high"
                 ),
                 "total_breaking_changes": len(breaking_changes),
                 "severity": "high" if breaking_changes else "none",
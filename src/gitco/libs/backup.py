@@ -676,9 +676,7 @@ def print_backup_info(metadata: BackupMetadata) -> None:
 
 [bold]Repositories:[/bold]
 """
-
-    for repo in metadata.repositories:
-        panel_content += f"  • {repo}\n"
+    panel_content += "".join(f"  • {repo}\n" for repo in metadata.repositories)
 
     panel = Panel(panel_content, title="Backup Information", box=box.ROUNDED)
     console.print(panel)
@@ -1,9 +1,13 @@
 """Configuration management for GitCo."""
 
+import copy
+import hashlib
+import json
 import os
 import re
 from dataclasses import dataclass, field
-from typing import Any, Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 
 import yaml
@@ -18,7 +22,86 @@ from ..utils.common import (
 )
 from ..utils.exception import ConfigurationError
 from .custom_endpoints import validate_custom_endpoints
-from .git_ops import GitRepositoryManager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .git_ops import GitRepositoryManager
+
+# Parsed configurations keyed by path, tagged with the file's (mtime_ns, size)
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], "Config"]] = {}
+
+# On-disk cache of the raw YAML data, one file per configuration path
+_DATA_CACHE_DIR = os.path.expanduser("~/.gitco/cache")
+_DATA_CACHE_VERSION = 2
+
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _has_only_str_keys(data: Any) -> bool:
+    """Check that every mapping in ``data`` is keyed by strings.
+
+    JSON turns other keys (ints, or booleans such as YAML's ``on:``) into
+    strings, so such documents would not survive a round trip through the cache.
+    """
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str) and _has_only_str_keys(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return all(_has_only_str_keys(item) for item in data)
+    return True
+
+
+def _load_config_data(config_path: str, file_key: tuple[int, int]) -> Any:
+    """Load raw configuration data, reusing the JSON cache when it is current.
+
+    Args:
+        config_path: Path to the YAML configuration file.
+        file_key: ``(mtime_ns, size)`` of the configuration file.
+
+    Returns:
+        The parsed YAML document.
+    """
+    abs_path = os.path.abspath(config_path)
+    digest = hashlib.sha256(abs_path.encode("utf-8")).hexdigest()
+    cache_path = os.path.join(_DATA_CACHE_DIR, f"config-{digest}.json")
+    key = [_DATA_CACHE_VERSION, abs_path, *file_key]
+    try:
+        with open(cache_path, "rb") as f:
+            raw = f.read()
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if cached["key"] == key:
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    with open(config_path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    # Caching is best effort: unwritable directories or values strict JSON
+    # cannot represent (e.g. NaN, which orjson rejects) simply leave the next
+    # run to parse the YAML again
+    if not _has_only_str_keys(data):
+        return data
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_DATA_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "data": data}, f, allow_nan=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return data
 
 
 @dataclass
@@ -93,6 +176,18 @@ class Settings:
     cost_log_file: str = "~/.gitco/cost_log.json"
 
 
+@dataclass(frozen=True)
+class GitHubCredentials:
+    """GitHub credentials resolved from the environment."""
+
+    token: Optional[str] = field(repr=False)
+    username: Optional[str]
+    password: Optional[str] = field(repr=False)
+    base_url: str = "https://api.github.com"
+    timeout: int = 30
+    max_retries: int = 3
+
+
 @dataclass
 class Config:
     """Main configuration class."""
@@ -100,6 +195,15 @@ class Config:
     repositories: Optional[list[Repository]] = None
     settings: Settings = field(default_factory=Settings)
 
+    @cached_property
+    def by_name(self) -> dict[str, Repository]:
+        """Repositories indexed by name; the first entry wins on duplicates."""
+        return {r.name: r for r in reversed(self.repositories or [])}
+
+    def clear_index(self) -> None:
+        """Drop the cached name index after the repository list changes."""
+        self.__dict__.pop("by_name", None)
+
 
 class ConfigValidator:
     """Validates GitCo configuration with detailed error reporting."""
@@ -108,7 +212,13 @@ class ConfigValidator:
         """Initialize the validator."""
         self.errors: list[ValidationError] = []
         self.warnings: list[ValidationError] = []
-        self.git_manager = GitRepositoryManager()
+
+    @cached_property
+    def git_manager(self) -> "GitRepositoryManager":
+        """Git manager for repository path checks, imported on first use."""
+        from .git_ops import GitRepositoryManager
+
+        return GitRepositoryManager()
 
     def validate_config(self, config: Config) -> dict[str, list[ValidationError]]:
         """Validate entire configuration with detailed error reporting.
@@ -672,10 +782,17 @@ class ConfigManager:
                     f"Configuration file not found: {self.config_path}"
                 )
 
-            with open(self.config_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # Reuse the parsed configuration while the file is unchanged
+            stat = os.stat(self.config_path)
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            cached = _CONFIG_CACHE.get(self.config_path)
+            if cached is not None and cached[0] == file_key:
+                config = copy.deepcopy(cached[1])
+            else:
+                data = _load_config_data(self.config_path, file_key)
+                config = self._parse_config(data)
+                _CONFIG_CACHE[self.config_path] = (file_key, copy.deepcopy(config))
 
-            config = self._parse_config(data)
             self.config = config  # Update the instance config
             log_operation_success("configuration loading", config_path=self.config_path)
             log_configuration_loaded(
@@ -705,6 +822,7 @@ class ConfigManager:
 
             with open(self.config_path, "w", encoding="utf-8") as f:
                 yaml.dump(data, f, default_flow_style=False, indent=2)
+            _CONFIG_CACHE.pop(self.config_path, None)
 
             log_operation_success("configuration saving", config_path=self.config_path)
 
@@ -714,6 +832,11 @@ class ConfigManager:
             )
             raise
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the in-process cache of parsed configuration files."""
+        _CONFIG_CACHE.clear()
+
     def create_default_config(self, force: bool = False) -> Config:
         """Create default configuration file.
 
@@ -790,11 +913,7 @@ class ConfigManager:
         Returns:
             Repository configuration or None if not found.
         """
-        if self.config.repositories is not None:
-            for repo in self.config.repositories:
-                if repo.name == name:
-                    return repo
-        return None
+        return self.config.by_name.get(name)
 
     def add_repository(self, repo: Repository) -> None:
         """Add repository to configuration.
@@ -810,6 +929,7 @@ class ConfigManager:
             self.config.repositories.append(repo)
         else:
             self.config.repositories = [repo]
+        self.config.clear_index()
 
     def remove_repository(self, name: str) -> bool:
         """Remove repository from configuration.
@@ -825,25 +945,26 @@ class ConfigManager:
             self.config.repositories = [
                 r for r in self.config.repositories if r.name != name
             ]
+            self.config.clear_index()
             return len(self.config.repositories) < initial_count
         return False
 
-    def get_github_credentials(self) -> dict[str, Union[Optional[str], int]]:
+    def get_github_credentials(self) -> GitHubCredentials:
         """Get GitHub credentials from environment variables.
 
         Returns:
-            Dictionary with GitHub credentials.
+            GitHub credentials.
         """
         settings = self.config.settings
 
-        return {
-            "token": os.getenv(settings.github_token_env),
-            "username": os.getenv(settings.github_username_env),
-            "password": os.getenv(settings.github_password_env),
-            "base_url": settings.github_api_url,
-            "timeout": settings.github_timeout,
-            "max_retries": settings.github_max_retries,
-        }
+        return GitHubCredentials(
+            token=os.getenv(settings.github_token_env),
+            username=os.getenv(settings.github_username_env),
+            password=os.getenv(settings.github_password_env),
+            base_url=settings.github_api_url or "https://api.github.com",
+            timeout=settings.github_timeout,
+            max_retries=settings.github_max_retries,
+        )
 
     def _parse_config(self, data: dict[str, Any]) -> Config:
         """Parse configuration from dictionary.
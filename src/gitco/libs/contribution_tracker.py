@@ -1,10 +1,16 @@
 """Contribution history tracking for GitCo."""
 
+import heapq
 import json
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import islice
+from math import fsum
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ..utils.common import (
     get_logger,
@@ -14,7 +20,9 @@ from ..utils.common import (
 )
 from ..utils.exception import ContributionTrackerError
 from .config import Config
-from .github_client import GitHubClient, GitHubIssue
+
+if TYPE_CHECKING:
+    from .github_client import GitHubClient, GitHubIssue
 
 
 @dataclass
@@ -37,6 +45,16 @@ class Contribution:
     comments_count: int = 0
     reactions_count: int = 0
 
+    @cached_property
+    def created_datetime(self) -> datetime:
+        """Creation time, parsed once from ``created_at``."""
+        return datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))
+
+    @cached_property
+    def updated_datetime(self) -> datetime:
+        """Last update time, parsed once from ``updated_at``."""
+        return datetime.fromisoformat(self.updated_at.replace("Z", "+00:00"))
+
     def to_dict(self) -> dict:
         """Convert contribution to dictionary."""
         return {
@@ -128,25 +146,51 @@ class ContributionStats:
     sustainability_score: float = 0.0  # Long-term contribution sustainability
 
 
+_impact_score = attrgetter("impact_score")
+
+
+def _mean_impact(contributions: list[Contribution]) -> float:
+    """Average impact score of a non-empty list of contributions."""
+    return fsum(map(_impact_score, contributions)) / len(contributions)
+
+
 class ContributionTracker:
     """Tracks user contributions across repositories."""
 
-    def __init__(self, config: Config, github_client: Optional[GitHubClient]):
+    def __init__(
+        self,
+        config: Config,
+        github_client: Optional["GitHubClient"],
+        max_workers: Optional[int] = None,
+    ):
         """Initialize contribution tracker.
 
         Args:
             config: GitCo configuration
             github_client: GitHub API client (can be None if no credentials)
+            max_workers: Maximum concurrent GitHub requests when syncing
         """
         self.config = config
         self.github_client = github_client
+        self.max_workers = max_workers
         self.logger = get_logger()
         self.history_file = Path("~/.gitco/contribution_history.json").expanduser()
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Parsed history tagged with the file's (mtime_ns, size); contributions
+        # in it are shared with callers, so they are replaced, never mutated
+        self._history_cache: Optional[tuple[tuple[int, int], list[Contribution]]] = None
+
+    def _history_file_key(self) -> tuple[int, int]:
+        """Return the ``(mtime_ns, size)`` of the history file."""
+        stat = self.history_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     def load_contribution_history(self) -> list[Contribution]:
         """Load contribution history from file.
 
+        The parsed history is reused until the file changes on disk.
+
         Returns:
             List of contributions
         """
@@ -155,12 +199,22 @@ class ContributionTracker:
         )
 
         try:
-            if not self.history_file.exists():
+            try:
+                file_key = self._history_file_key()
+            except FileNotFoundError:
                 log_operation_success(
                     "loading contribution history", contributions_count=0
                 )
                 return []
 
+            if self._history_cache is not None and self._history_cache[0] == file_key:
+                contributions = list(self._history_cache[1])
+                log_operation_success(
+                    "loading contribution history",
+                    contributions_count=len(contributions),
+                )
+                return contributions
+
             with open(self.history_file, encoding="utf-8") as f:
                 data = json.load(f)
 
@@ -185,6 +239,7 @@ class ContributionTracker:
                 )
                 contributions.append(contribution)
 
+            self._history_cache = (file_key, list(contributions))
             log_operation_success(
                 "loading contribution history", contributions_count=len(contributions)
             )
@@ -231,8 +286,11 @@ class ContributionTracker:
                 ],
             }
 
+            # Encode in one call and write once; json.dump writes per token
+            payload = json.dumps(data, indent=2, ensure_ascii=False)
             with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(payload)
+            self._history_cache = (self._history_file_key(), list(contributions))
 
             log_operation_success(
                 "saving contribution history", contributions_count=len(contributions)
@@ -257,33 +315,7 @@ class ContributionTracker:
         )
 
         try:
-            contributions = self.load_contribution_history()
-
-            # Check if contribution already exists
-            existing = next(
-                (
-                    c
-                    for c in contributions
-                    if c.repository == contribution.repository
-                    and c.issue_number == contribution.issue_number
-                ),
-                None,
-            )
-
-            if existing:
-                # Update existing contribution
-                existing.updated_at = contribution.updated_at
-                existing.status = contribution.status
-                existing.skills_used = contribution.skills_used
-                existing.impact_score = contribution.impact_score
-                existing.labels = contribution.labels
-                existing.comments_count = contribution.comments_count
-                existing.reactions_count = contribution.reactions_count
-            else:
-                # Add new contribution
-                contributions.append(contribution)
-
-            self.save_contribution_history(contributions)
+            self._merge_contributions([contribution])
             log_operation_success(
                 "adding contribution",
                 repository=contribution.repository,
@@ -294,6 +326,43 @@ class ContributionTracker:
             log_operation_failure("adding contribution", e)
             raise ContributionTrackerError(f"Failed to add contribution: {e}") from e
 
+    def _merge_contributions(self, new_contributions: list[Contribution]) -> None:
+        """Merge contributions into the history and save it once.
+
+        Contributions already in the history (same repository and issue
+        number) are updated in place; the rest are appended.
+
+        Args:
+            new_contributions: Contributions to add or update
+        """
+        contributions = self.load_contribution_history()
+
+        positions: dict[tuple[str, int], int] = {}
+        for i, c in enumerate(contributions):
+            positions.setdefault((c.repository, c.issue_number), i)
+
+        for contribution in new_contributions:
+            key = (contribution.repository, contribution.issue_number)
+            index = positions.get(key)
+            if index is not None:
+                # Update existing contribution
+                contributions[index] = replace(
+                    contributions[index],
+                    updated_at=contribution.updated_at,
+                    status=contribution.status,
+                    skills_used=contribution.skills_used,
+                    impact_score=contribution.impact_score,
+                    labels=contribution.labels,
+                    comments_count=contribution.comments_count,
+                    reactions_count=contribution.reactions_count,
+                )
+            else:
+                # Add new contribution
+                positions[key] = len(contributions)
+                contributions.append(contribution)
+
+        self.save_contribution_history(contributions)
+
     def get_contribution_stats(self, days: Optional[int] = None) -> ContributionStats:
         """Get contribution statistics.
 
@@ -311,10 +380,7 @@ class ContributionTracker:
             if days:
                 cutoff_date = datetime.now() - timedelta(days=days)
                 contributions = [
-                    c
-                    for c in contributions
-                    if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                    > cutoff_date
+                    c for c in contributions if c.updated_datetime > cutoff_date
                 ]
 
             stats = ContributionStats()
@@ -353,9 +419,7 @@ class ContributionTracker:
 
             for contribution in contributions:
                 try:
-                    date = datetime.fromisoformat(
-                        contribution.created_at.replace("Z", "+00:00")
-                    )
+                    date = contribution.created_datetime
                     month_key = date.strftime("%Y-%m")
                     if month_key in timeline:
                         timeline[month_key] += 1
@@ -365,14 +429,11 @@ class ContributionTracker:
             stats.contribution_timeline = timeline
 
             # Get recent activity (last 10 contributions)
-            sorted_contributions = sorted(
+            stats.recent_activity = heapq.nlargest(
+                10,
                 contributions,
-                key=lambda x: datetime.fromisoformat(
-                    x.updated_at.replace("Z", "+00:00")
-                ),
-                reverse=True,
+                key=attrgetter("updated_datetime"),
             )
-            stats.recent_activity = sorted_contributions[:10]
 
             # Calculate enhanced impact metrics and trending analysis
             self._calculate_enhanced_impact_metrics(contributions, stats)
@@ -405,7 +466,10 @@ class ContributionTracker:
         try:
             # Get user's issues and PRs
             issues = self.github_client.search_issues(
-                query=f"author:{username}", state="all", limit=100
+                query=f"author:{username}",
+                state="all",
+                limit=100,
+                max_workers=self.max_workers,
             )
 
             contributions = []
@@ -442,9 +506,8 @@ class ContributionTracker:
                 )
                 contributions.append(contribution)
 
-            # Save all contributions
-            for contribution in contributions:
-                self.add_contribution(contribution)
+            # Save all contributions with a single history write
+            self._merge_contributions(contributions)
 
             log_operation_success(
                 "syncing contributions from GitHub",
@@ -457,7 +520,7 @@ class ContributionTracker:
                 f"Failed to sync contributions from GitHub: {e}"
             ) from e
 
-    def _calculate_impact_score(self, issue: GitHubIssue) -> float:
+    def _calculate_impact_score(self, issue: "GitHubIssue") -> float:
         """Calculate impact score for an issue.
 
         Args:
@@ -547,47 +610,37 @@ class ContributionTracker:
 
             # Filter contributions by time periods
             recent_30d = [
-                c
-                for c in contributions
-                if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                >= thirty_days_ago
+                c for c in contributions if c.updated_datetime >= thirty_days_ago
             ]
             recent_7d = [
-                c
-                for c in contributions
-                if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                >= seven_days_ago
+                c for c in contributions if c.updated_datetime >= seven_days_ago
             ]
 
             # Calculate trends (comparing recent vs older periods)
             if recent_30d:
-                avg_recent_30d = sum(c.impact_score for c in recent_30d) / len(
-                    recent_30d
-                )
+                avg_recent_30d = _mean_impact(recent_30d)
                 older_30d = [c for c in contributions if c not in recent_30d]
                 if older_30d:
-                    avg_older_30d = sum(c.impact_score for c in older_30d) / len(
-                        older_30d
-                    )
+                    avg_older_30d = _mean_impact(older_30d)
                     stats.impact_trend_30d = avg_recent_30d - avg_older_30d
                 else:
                     stats.impact_trend_30d = avg_recent_30d
 
             if recent_7d:
-                avg_recent_7d = sum(c.impact_score for c in recent_7d) / len(recent_7d)
+                avg_recent_7d = _mean_impact(recent_7d)
                 older_7d = [c for c in contributions if c not in recent_7d]
                 if older_7d:
-                    avg_older_7d = sum(c.impact_score for c in older_7d) / len(older_7d)
+                    avg_older_7d = _mean_impact(older_7d)
                     stats.impact_trend_7d = avg_recent_7d - avg_older_7d
                 else:
                     stats.impact_trend_7d = avg_recent_7d
 
             # Count high impact contributions
-            stats.high_impact_contributions = len(
-                [c for c in contributions if c.impact_score > 0.7]
+            stats.high_impact_contributions = sum(
+                1 for c in contributions if c.impact_score > 0.7
             )
-            stats.critical_contributions = len(
-                [c for c in contributions if c.impact_score > 0.9]
+            stats.critical_contributions = sum(
+                1 for c in contributions if c.impact_score > 0.9
             )
 
         except Exception as e:
@@ -613,9 +666,7 @@ class ContributionTracker:
 
             for skill, skill_contribs in skill_contributions.items():
                 if skill_contribs:
-                    avg_impact = sum(c.impact_score for c in skill_contribs) / len(
-                        skill_contribs
-                    )
+                    avg_impact = _mean_impact(skill_contribs)
                     stats.skill_impact_scores[skill] = avg_impact
 
         except Exception as e:
@@ -641,9 +692,7 @@ class ContributionTracker:
 
             for repo, repo_contribs in repo_contributions.items():
                 if repo_contribs:
-                    avg_impact = sum(c.impact_score for c in repo_contribs) / len(
-                        repo_contribs
-                    )
+                    avg_impact = _mean_impact(repo_contribs)
                     stats.repository_impact_scores[repo] = avg_impact
 
         except Exception as e:
@@ -665,10 +714,7 @@ class ContributionTracker:
 
             # Calculate contribution velocity (contributions per day over last 30 days)
             recent_30d = [
-                c
-                for c in contributions
-                if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                >= thirty_days_ago
+                c for c in contributions if c.updated_datetime >= thirty_days_ago
             ]
             stats.contribution_velocity = len(recent_30d) / 30.0
 
@@ -704,31 +750,27 @@ class ContributionTracker:
             sixty_days_ago: 60 days ago timestamp
         """
         try:
-            # Group contributions by skill and time period
-            skill_periods = {}
+            # Count skill usage per time period, classifying each contribution
+            # once; skills keeps every skill in first-seen order
+            skills: dict[str, None] = {}
+            recent: Counter[str] = Counter()
+            older: Counter[str] = Counter()
 
             for contribution in contributions:
-                contrib_date = datetime.fromisoformat(
-                    contribution.updated_at.replace("Z", "+00:00")
-                )
+                contrib_date = contribution.updated_datetime
+                skills.update(dict.fromkeys(contribution.skills_used))
 
-                for skill in contribution.skills_used:
-                    if skill not in skill_periods:
-                        skill_periods[skill] = {"recent": 0, "older": 0}
-
-                    if contrib_date >= thirty_days_ago:
-                        skill_periods[skill]["recent"] += 1
-                    elif contrib_date >= sixty_days_ago:
-                        skill_periods[skill]["older"] += 1
+                if contrib_date >= thirty_days_ago:
+                    recent.update(contribution.skills_used)
+                elif contrib_date >= sixty_days_ago:
+                    older.update(contribution.skills_used)
 
             # Calculate growth rates
-            for skill, periods in skill_periods.items():
-                if periods["older"] > 0:
-                    growth_rate = (periods["recent"] - periods["older"]) / periods[
-                        "older"
-                    ]
+            for skill in skills:
+                if older[skill] > 0:
+                    growth_rate = (recent[skill] - older[skill]) / older[skill]
                     stats.skill_growth_rate[skill] = growth_rate
-                elif periods["recent"] > 0:
+                elif recent[skill] > 0:
                     stats.skill_growth_rate[skill] = 1.0  # New skill
                 else:
                     stats.skill_growth_rate[skill] = 0.0
@@ -756,9 +798,7 @@ class ContributionTracker:
             repo_periods = {}
 
             for contribution in contributions:
-                contrib_date = datetime.fromisoformat(
-                    contribution.updated_at.replace("Z", "+00:00")
-                )
+                contrib_date = contribution.updated_datetime
                 repo = contribution.repository
 
                 if repo not in repo_periods:
@@ -800,11 +840,10 @@ class ContributionTracker:
                 elif growth_rate <= declining_threshold:
                     stats.declining_skills.append(skill)
 
-            # Sort by growth rate
-            stats.trending_skills.sort(
-                key=lambda s: stats.skill_growth_rate.get(s, 0), reverse=True
-            )
-            stats.declining_skills.sort(key=lambda s: stats.skill_growth_rate.get(s, 0))
+            # Sort by growth rate; every listed skill has a rate
+            growth_rate_of = stats.skill_growth_rate.__getitem__
+            stats.trending_skills.sort(key=growth_rate_of, reverse=True)
+            stats.declining_skills.sort(key=growth_rate_of)
 
         except Exception as e:
             self.logger.warning(f"Failed to identify trending skills: {e}")
@@ -863,10 +902,7 @@ class ContributionTracker:
             # Sustainability score (based on consistent contribution over time)
             if len(contributions) > 1:
                 # Calculate consistency over time
-                dates = [
-                    datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                    for c in contributions
-                ]
+                dates = [c.updated_datetime for c in contributions]
                 dates.sort()
 
                 if len(dates) > 1:
@@ -883,7 +919,7 @@ class ContributionTracker:
         except Exception as e:
             self.logger.warning(f"Failed to calculate advanced metrics: {e}")
 
-    def _extract_skills_from_issue(self, issue: GitHubIssue) -> list[str]:
+    def _extract_skills_from_issue(self, issue: "GitHubIssue") -> list[str]:
         """Extract skills from issue labels and content.
 
         Args:
@@ -980,9 +1016,7 @@ class ContributionTracker:
                 )
 
             # Find most successful skills and repositories
-            top_skills = sorted(
-                skill_frequency.items(), key=lambda x: x[1], reverse=True
-            )[:5]
+            top_skills = heapq.nlargest(5, skill_frequency.items(), key=itemgetter(1))
 
             # Create recommendations based on patterns
             recommendations = []
@@ -990,14 +1024,13 @@ class ContributionTracker:
             # Recommend continuing in successful areas
             for skill, _ in top_skills:
                 if skill in user_skills:
-                    # Find recent high-impact contributions in this skill
-                    skill_contributions = [
+                    # Take the first two high-impact contributions in this skill
+                    high_impact = (
                         c
                         for c in contributions
                         if skill in c.skills_used and c.impact_score > 0.5
-                    ]
-                    if skill_contributions:
-                        recommendations.extend(skill_contributions[:2])
+                    )
+                    recommendations.extend(islice(high_impact, 2))
 
             # Recommend exploring new skills
             for skill in user_skills:
@@ -1020,15 +1053,18 @@ class ContributionTracker:
 
 
 def create_contribution_tracker(
-    config: Config, github_client: Optional[GitHubClient]
+    config: Config,
+    github_client: Optional["GitHubClient"],
+    max_workers: Optional[int] = None,
 ) -> ContributionTracker:
     """Create a contribution tracker instance.
 
     Args:
         config: GitCo configuration
         github_client: GitHub API client (can be None if no credentials)
+        max_workers: Maximum concurrent GitHub requests when syncing
 
     Returns:
         Contribution tracker instance
     """
-    return ContributionTracker(config, github_client)
+    return ContributionTracker(config, github_client, max_workers=max_workers)
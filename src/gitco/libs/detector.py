@@ -3,6 +3,7 @@
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cache
 from typing import Optional
 
 from ..utils.common import get_logger
@@ -19,6 +20,57 @@ from .patterns import (
     SECURITY_PATTERNS,
 )
 
+# Component extraction patterns: file names, function names, class names
+_COMPONENT_PATTERNS = (
+    r"(\w+\.py)",
+    r"(\w+\.js)",
+    r"(\w+\.ts)",
+    r"(\w+\.java)",
+    r"(\w+\.go)",
+    r"(\w+\.rs)",
+    r"def\s+(\w+)",
+    r"function\s+(\w+)",
+    r"(\w+)\s*\([^)]*\)",
+    r"class\s+(\w+)",
+)
+
+# Filename patterns marking configuration, database and dependency files
+_CONFIG_FILE_PATTERNS = (
+    r"\.env",
+    r"\.ini",
+    r"\.toml",
+    r"\.yaml",
+    r"\.yml",
+    r"config",
+    r"settings",
+)
+_DATABASE_FILE_PATTERNS = (r"migration", r"schema", r"\.sql", r"database")
+_DEPENDENCY_FILE_PATTERNS = (
+    r"requirements\.txt",
+    r"pyproject\.toml",
+    r"setup\.py",
+    r"package\.json",
+    r"Gemfile",
+    r"go\.mod",
+    r"Cargo\.toml",
+)
+
+
+@cache
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a case-insensitive detection pattern once per process.
+
+    Args:
+        pattern: Regex pattern string.
+
+    Returns:
+        Compiled pattern.
+
+    Raises:
+        re.error: If the pattern is invalid.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
 
 @dataclass
 class SecurityUpdate:
@@ -106,7 +158,7 @@ class BaseDetector(ABC):
         for pattern_type, pattern_list in patterns.items():
             for pattern in pattern_list:
                 try:
-                    matches_found = re.finditer(pattern, text_lower, re.IGNORECASE)
+                    matches_found = _compile(pattern).finditer(text_lower)
                     for match in matches_found:
                         matches.append((pattern_type, match.group()))
                 except re.error as e:
@@ -131,12 +183,12 @@ class BaseDetector(ABC):
 
         # Check for high severity patterns
         for pattern in high_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            if _compile(pattern).search(text_lower):
                 return "high"
 
         # Check for medium severity patterns
         for pattern in medium_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            if _compile(pattern).search(text_lower):
                 return "medium"
 
         return "low"
@@ -153,30 +205,8 @@ class BaseDetector(ABC):
         components = []
 
         # Look for file names, function names, class names, etc.
-        file_patterns = [
-            r"(\w+\.py)",
-            r"(\w+\.js)",
-            r"(\w+\.ts)",
-            r"(\w+\.java)",
-            r"(\w+\.go)",
-            r"(\w+\.rs)",
-        ]
-
-        function_patterns = [
-            r"def\s+(\w+)",
-            r"function\s+(\w+)",
-            r"(\w+)\s*\([^)]*\)",
-        ]
-
-        class_patterns = [
-            r"class\s+(\w+)",
-        ]
-
-        all_patterns = file_patterns + function_patterns + class_patterns
-
-        for pattern in all_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            components.extend(matches)
+        for pattern in _COMPONENT_PATTERNS:
+            components.extend(_compile(pattern).findall(text))
 
         # Remove duplicates and filter out common words
         common_words = {
@@ -283,7 +313,7 @@ class SecurityDeprecationDetector(BaseDetector):
         message_lower = message.lower()
 
         # Check for explicit CVE references
-        cve_matches = re.findall(r"CVE-\d{4}-\d+", message, re.IGNORECASE)
+        cve_matches = _compile(r"CVE-\d{4}-\d+").findall(message)
         for cve_id in cve_matches:
             severity = self._determine_security_severity(message_lower)
             security_updates.append(
@@ -666,18 +696,7 @@ class BreakingChangeDetector(BaseDetector):
             True if configuration changes are detected.
         """
         # Check filename patterns
-        config_patterns = [
-            r"\.env",
-            r"\.ini",
-            r"\.toml",
-            r"\.yaml",
-            r"\.yml",
-            r"config",
-            r"settings",
-        ]
-        if any(
-            re.search(pattern, filename, re.IGNORECASE) for pattern in config_patterns
-        ):
+        if any(_compile(pattern).search(filename) for pattern in _CONFIG_FILE_PATTERNS):
             return True
 
         # Use base class pattern matching for content
@@ -697,13 +716,9 @@ class BreakingChangeDetector(BaseDetector):
             True if database changes are detected.
         """
         # Check filename patterns
-        db_patterns = [
-            r"migration",
-            r"schema",
-            r"\.sql",
-            r"database",
-        ]
-        if any(re.search(pattern, filename, re.IGNORECASE) for pattern in db_patterns):
+        if any(
+            _compile(pattern).search(filename) for pattern in _DATABASE_FILE_PATTERNS
+        ):
             return True
 
         # Use base class pattern matching for content
@@ -723,16 +738,9 @@ class BreakingChangeDetector(BaseDetector):
             True if dependency changes are detected.
         """
         # Check filename patterns
-        dep_patterns = [
-            r"requirements\.txt",
-            r"pyproject\.toml",
-            r"setup\.py",
-            r"package\.json",
-            r"Gemfile",
-            r"go\.mod",
-            r"Cargo\.toml",
-        ]
-        if any(re.search(pattern, filename, re.IGNORECASE) for pattern in dep_patterns):
+        if any(
+            _compile(pattern).search(filename) for pattern in _DEPENDENCY_FILE_PATTERNS
+        ):
             return True
 
         # Use base class pattern matching for content
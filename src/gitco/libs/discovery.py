@@ -1,11 +1,16 @@
 """Issue discovery and skill-based matching for GitCo."""
 
+import heapq
+import io
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Union
+from functools import partial
+from operator import attrgetter
+from typing import Optional
 
+from rich.markup import escape
 from rich.panel import Panel
-from rich.text import Text
 
 from ..patterns.constants import DIFFICULTY_INDICATORS, SKILL_SYNONYMS, TIME_PATTERNS
 from ..utils.common import (
@@ -19,6 +24,45 @@ from ..utils.exception import DiscoveryError
 from .config import Config, Repository
 from .github_client import GitHubClient, GitHubIssue
 
+# Tag categories used when rendering recommendations
+_SKILL_TAGS = frozenset(
+    {
+        "python",
+        "javascript",
+        "java",
+        "go",
+        "rust",
+        "react",
+        "vue",
+        "angular",
+        "api",
+        "database",
+        "testing",
+        "devops",
+    }
+)
+_DIFFICULTY_TAGS = frozenset({"beginner", "intermediate", "advanced"})
+_TIME_TAGS = frozenset({"quick", "medium", "long"})
+
+# (score threshold, confidence indicator, border style), checked in order
+_SCORE_BUCKETS = (
+    (0.8, "🎯 Excellent Match", "green"),
+    (0.7, "⭐ Good Match", "green"),
+    (0.6, "⭐ Good Match", "yellow"),
+    (0.4, "💡 Good Opportunity", "yellow"),
+)
+_DEFAULT_SCORE_BUCKET = ("🔍 Exploration", "blue")
+
+# Display labels for the difficulty and time tags, titled once up front
+_TAG_LABELS = {tag: tag.title() for tag in _DIFFICULTY_TAGS | _TIME_TAGS}
+
+_MATCH_TYPE_EMOJI = {
+    "exact": "🎯",
+    "partial": "📝",
+    "related": "🔗",
+    "language": "💻",
+}
+
 
 @dataclass
 class SkillMatch:
@@ -313,29 +357,42 @@ class IssueDiscovery:
         try:
             recommendations = []
 
-            if self.config.repositories is not None:
-                for repo in self.config.repositories:
-                    # Skip if skill filter doesn't match repository skills
-                    if skill_filter and skill_filter.lower() not in [
-                        s.lower() for s in repo.skills
-                    ]:
-                        continue
+            # Skip repositories whose skills don't match the skill filter
+            repositories = [
+                repo
+                for repo in self.config.repositories or []
+                if not skill_filter
+                or skill_filter.lower() in [s.lower() for s in repo.skills]
+            ]
 
-                    repo_recommendations = self._discover_for_repository(
-                        repo,
-                        skill_filter,
-                        label_filter,
-                        min_confidence,
-                        include_personalization,
+            if repositories:
+                # Each repository costs a GitHub round-trip, so fetch them
+                # concurrently; max_repos_per_batch caps the API fan-out
+                max_workers = min(
+                    32, self.config.settings.max_repos_per_batch, len(repositories)
+                )
+                with ThreadPoolExecutor(
+                    max_workers=max(1, max_workers), thread_name_prefix="gitco-discover"
+                ) as executor:
+                    discover_for_repository = partial(
+                        self._discover_for_repository,
+                        skill_filter=skill_filter,
+                        label_filter=label_filter,
+                        min_confidence=min_confidence,
+                        include_personalization=include_personalization,
                     )
-                    recommendations.extend(repo_recommendations)
-
-            # Sort by overall score (descending)
-            recommendations.sort(key=lambda x: x.overall_score, reverse=True)
-
-            # Apply limit
+                    for repo_recommendations in executor.map(
+                        discover_for_repository, repositories
+                    ):
+                        recommendations.extend(repo_recommendations)
+
+            # Sort by overall score (descending), selecting only the top
+            # ``limit`` recommendations when a limit is given
+            by_score = attrgetter("overall_score")
             if limit:
-                recommendations = recommendations[:limit]
+                recommendations = heapq.nlargest(limit, recommendations, key=by_score)
+            else:
+                recommendations.sort(key=by_score, reverse=True)
 
             log_operation_success(
                 "issue discovery", recommendations_count=len(recommendations)
@@ -605,7 +662,7 @@ class IssueDiscovery:
 
             # Bonus for preferred difficulty level
             preferred_difficulty = max(
-                difficulty_counts, key=lambda k: difficulty_counts[k]
+                difficulty_counts, key=difficulty_counts.__getitem__
             )
             if (
                 difficulty == preferred_difficulty
@@ -743,142 +800,123 @@ def create_discovery_engine(
     return IssueDiscovery(github_client, config)
 
 
-def print_issue_recommendation(
-    recommendation: "IssueRecommendation", index: int
-) -> None:
-    """Print a formatted issue recommendation.
+def render_issue_recommendation(
+    recommendation: IssueRecommendation, index: int
+) -> Optional[Panel]:
+    """Build the panel for a formatted issue recommendation.
 
     Args:
         recommendation: The issue recommendation to display
         index: The recommendation number/index
+
+    Returns:
+        The recommendation panel, or None if ``recommendation`` is not an
+        IssueRecommendation
     """
     if not isinstance(recommendation, IssueRecommendation):
-        return
+        return None
 
-    # Build the content
-    content: list[Union[Text, str]] = []
+    # Build the panel body in a single buffer
+    buf = io.StringIO()
+    write = buf.write
 
     # Issue title and URL
-    title_text = Text(f"#{recommendation.issue.number}: {recommendation.issue.title}")
-    title_text.stylize("bold blue")
-    content.append(title_text)
-    content.append(f"🔗 {recommendation.issue.html_url}")
-    content.append("")
+    write(
+        f"[bold blue]#{recommendation.issue.number}: "
+        f"{escape(recommendation.issue.title)}[/bold blue]\n"
+    )
+    write(f"🔗 {recommendation.issue.html_url}\n\n")
 
     # Repository info
-    content.append(f"📁 Repository: {recommendation.repository.name}")
+    write(f"📁 Repository: {recommendation.repository.name}\n")
     if recommendation.repository.language:
-        content.append(f"💻 Language: {recommendation.repository.language}")
-    content.append("")
+        write(f"💻 Language: {recommendation.repository.language}\n")
+    write("\n")
 
     # Score and difficulty with enhanced information
     score_text = f"Score: {recommendation.overall_score:.2f}"
-    difficulty_text = f"Difficulty: {recommendation.difficulty_level.title()}"
-    time_text = f"Time: {recommendation.estimated_time.title()}"
-
-    # Add confidence indicator
-    if recommendation.overall_score > 0.8:
-        confidence_indicator = "🎯 Excellent Match"
-    elif recommendation.overall_score > 0.6:
-        confidence_indicator = "⭐ Good Match"
-    elif recommendation.overall_score > 0.4:
-        confidence_indicator = "💡 Good Opportunity"
-    else:
-        confidence_indicator = "🔍 Exploration"
-
-    content.append(
-        f"{confidence_indicator} | {score_text} | 🎯 {difficulty_text} | ⏱️ {time_text}"
+    difficulty = recommendation.difficulty_level
+    estimated_time = recommendation.estimated_time
+    difficulty_text = f"Difficulty: {_TAG_LABELS.get(difficulty) or difficulty.title()}"
+    time_text = f"Time: {_TAG_LABELS.get(estimated_time) or estimated_time.title()}"
+
+    # Confidence indicator and border style from the score bucket table
+    confidence_indicator, border_style = _DEFAULT_SCORE_BUCKET
+    for threshold, indicator, style in _SCORE_BUCKETS:
+        if recommendation.overall_score > threshold:
+            confidence_indicator, border_style = indicator, style
+            break
+
+    write(
+        f"{confidence_indicator} | {score_text} | 🎯 {difficulty_text} | ⏱️ {time_text}\n\n"
     )
-    content.append("")
 
     # Skill matches with enhanced details
     if recommendation.skill_matches:
-        content.append("🎯 Skill Matches:")
+        write("🎯 Skill Matches:\n")
         for match in recommendation.skill_matches:
             confidence_text = f"({match.confidence:.1%})"
-            match_type_emoji = {
-                "exact": "🎯",
-                "partial": "📝",
-                "related": "🔗",
-                "language": "💻",
-            }.get(match.match_type, "📌")
+            match_type_emoji = _MATCH_TYPE_EMOJI.get(match.match_type, "📌")
 
-            match_text = f"  {match_type_emoji} {match.skill} {confidence_text} [{match.match_type}]"
-            content.append(match_text)
+            write(
+                f"  {match_type_emoji} {match.skill} {confidence_text} [{match.match_type}]\n"
+            )
 
             # Show evidence for high-confidence matches
             if match.confidence > 0.7 and match.evidence:
-                evidence_text = f"    Evidence: {match.evidence[0][:60]}..."
-                content.append(f"    {evidence_text}")
-        content.append("")
+                write(f"        Evidence: {match.evidence[0][:60]}...\n")
+        write("\n")
 
     # Tags with categorization
     if recommendation.tags:
-        # Categorize tags
-        skill_tags: list[str] = [
-            tag
-            for tag in recommendation.tags
-            if tag
-            in [
-                "python",
-                "javascript",
-                "java",
-                "go",
-                "rust",
-                "react",
-                "vue",
-                "angular",
-                "api",
-                "database",
-                "testing",
-                "devops",
-            ]
-        ]
-        difficulty_tags: list[str] = [
-            tag
-            for tag in recommendation.tags
-            if tag in ["beginner", "intermediate", "advanced"]
-        ]
-        time_tags: list[str] = [
-            tag for tag in recommendation.tags if tag in ["quick", "medium", "long"]
-        ]
-        special_tags: list[str] = [
-            tag
-            for tag in recommendation.tags
-            if tag not in skill_tags + difficulty_tags + time_tags
-        ]
+        # Categorize tags in a single pass
+        skill_tags: list[str] = []
+        difficulty_tags: list[str] = []
+        time_tags: list[str] = []
+        special_tags: list[str] = []
+        for tag in recommendation.tags:
+            if tag in _SKILL_TAGS:
+                skill_tags.append(tag)
+            elif tag in _DIFFICULTY_TAGS:
+                difficulty_tags.append(tag)
+            elif tag in _TIME_TAGS:
+                time_tags.append(tag)
+            else:
+                special_tags.append(tag)
 
         if skill_tags:
-            content.append(f"💻 Skills: {', '.join(skill_tags)}")
+            write(f"💻 Skills: {', '.join(skill_tags)}\n")
         if difficulty_tags:
-            content.append(f"🎯 Level: {', '.join(difficulty_tags)}")
+            write(f"🎯 Level: {', '.join(difficulty_tags)}\n")
         if time_tags:
-            content.append(f"⏱️ Time: {', '.join(time_tags)}")
+            write(f"⏱️ Time: {', '.join(time_tags)}\n")
         if special_tags:
-            content.append(f"🏷️ Tags: {', '.join(special_tags)}")
-        content.append("")
+            write(f"🏷️ Tags: {', '.join(special_tags)}\n")
+        write("\n")
 
     # Personalized insights (if available)
     if hasattr(recommendation, "personalized_insights"):
-        content.append("💡 Personalized Insights:")
+        write("💡 Personalized Insights:\n")
         for insight in recommendation.personalized_insights[:2]:  # Show top 2 insights
-            content.append(f"  • {insight}")
-        content.append("")
+            write(f"  • {insight}\n")
+        write("\n")
 
     # Create the panel with dynamic styling
-    border_style = (
-        "green"
-        if recommendation.overall_score > 0.7
-        else "yellow"
-        if recommendation.overall_score > 0.4
-        else "blue"
-    )
-
-    panel = Panel(
-        "\n".join(str(item) for item in content),
+    return Panel(
+        buf.getvalue()[:-1],  # Drop the trailing line break
         title=f"Recommendation #{index}",
         border_style=border_style,
     )
 
-    console.print(panel)
-    console.print()  # Add spacing
+
+def print_issue_recommendation(recommendation: IssueRecommendation, index: int) -> None:
+    """Print a formatted issue recommendation.
+
+    Args:
+        recommendation: The issue recommendation to display
+        index: The recommendation number/index
+    """
+    panel = render_issue_recommendation(recommendation, index)
+    if panel is not None:
+        # Panel and trailing spacing line go out in a single write
+        console.print(panel, "")
@@ -2,12 +2,98 @@
 
 import csv
 import json
+import os
+import stat
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..utils.common import get_logger, print_error_panel, print_success_panel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _write_json(
+    export_file: Path, data: Any, default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """Write ``data`` as indented UTF-8 JSON, using orjson when it is installed.
+
+    The document is serialized in memory and published with an atomic
+    rename, so readers never see a partially written export. Symlinks are
+    followed, an existing file keeps its permissions, and targets that are
+    not regular files (e.g. ``/dev/stdout``) are written in place.
+
+    Args:
+        export_file: File to write
+        data: JSON-serializable data
+        default: Fallback serializer for otherwise unsupported objects
+    """
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data,
+                default=default,
+                # Hand datetimes and dataclasses to ``default`` as json does,
+                # so the output doesn't depend on whether orjson is installed
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            # orjson is stricter than json (e.g. integers beyond 64 bits)
+            pass
+    if payload is None:
+        payload = json.dumps(
+            data, indent=2, ensure_ascii=False, default=default
+        ).encode("utf-8")
+
+    # Replace what a symlink points at rather than the link itself
+    target = Path(os.path.realpath(export_file))
+    mode: Optional[int] = None
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISREG(target_stat.st_mode):
+            # Devices and pipes (e.g. /dev/stdout) can't be renamed over
+            with open(target, "wb") as f:
+                f.write(payload)
+            return
+        mode = stat.S_IMODE(target_stat.st_mode)
+
+    tmp_file = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_bytes(payload)
+        if mode is not None:
+            # Keep the permissions of the export being replaced
+            os.chmod(tmp_file, mode)
+        os.replace(tmp_file, target)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def export_json(
+    data: Any, export_path: str, default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """Write ``data`` to a JSON export file; callers report the outcome.
+
+    Args:
+        data: JSON-serializable data
+        export_path: Path to export the JSON file
+        default: Fallback serializer for otherwise unsupported objects
+    """
+    export_file = Path(export_path)
+    export_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(export_file, data, default=default)
+
 
 def export_sync_results(
     sync_data: dict[str, Any], export_path: str, repo_name: Optional[str] = None
@@ -60,8 +146,7 @@ def export_sync_results(
         export_file = Path(export_path)
         export_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(export_file, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+        _write_json(export_file, export_data, default=str)
 
         print_success_panel(
             "Export Successful",
@@ -125,8 +210,7 @@ def export_discovery_results(recommendations: Any, export_path: str) -> None:
         export_file = Path(export_path)
         export_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(export_file, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        _write_json(export_file, export_data)
 
         print_success_panel(
             "Export Successful",
@@ -142,6 +226,57 @@ def export_discovery_results(recommendations: Any, export_path: str) -> None:
         )
 
 
+def export_issues_by_repository(
+    issues_by_repository: dict[str, Any],
+    export_path: str,
+    repositories: list[str],
+    filters: dict[str, Any],
+) -> None:
+    """Export GitHub issues grouped by repository to a JSON file.
+
+    Args:
+        issues_by_repository: Mapping of repository name to its issues
+        export_path: Path to export the JSON file
+        repositories: Repositories that were requested
+        filters: Filters the issues were fetched with
+    """
+    try:
+        export_data = {
+            "timestamp": datetime.now().isoformat(),
+            "repositories": repositories,
+            "total_issues": sum(map(len, issues_by_repository.values())),
+            "filters": filters,
+            "issues": {
+                repo_name: [
+                    {
+                        "number": issue.number,
+                        "title": issue.title,
+                        "state": issue.state,
+                        "labels": issue.labels,
+                        "assignees": issue.assignees,
+                        "created_at": issue.created_at,
+                        "html_url": issue.html_url,
+                    }
+                    for issue in issues
+                ]
+                for repo_name, issues in issues_by_repository.items()
+            },
+        }
+
+        # Write to file
+        export_file = Path(export_path)
+        export_file.parent.mkdir(parents=True, exist_ok=True)
+
+        _write_json(export_file, export_data)
+
+        print_success_panel(f"Issues exported to {export_path}")
+
+    except Exception as e:
+        logger = get_logger()
+        logger.error(f"Failed to export issues: {e}")
+        print_error_panel("Failed to export issues", str(e))
+
+
 def export_contribution_data_to_csv(
     contributions: list[Any], export_path: str, include_stats: bool = True
 ) -> None:
@@ -210,15 +345,10 @@ def export_contribution_data_to_csv(
 
                 # Calculate basic stats
                 total_contributions = len(contributions)
-                open_contributions = len(
-                    [c for c in contributions if c.status == "open"]
-                )
-                closed_contributions = len(
-                    [c for c in contributions if c.status == "closed"]
-                )
-                merged_contributions = len(
-                    [c for c in contributions if c.status == "merged"]
-                )
+                status_counts = Counter(c.status for c in contributions)
+                open_contributions = status_counts["open"]
+                closed_contributions = status_counts["closed"]
+                merged_contributions = status_counts["merged"]
 
                 repositories = {c.repository for c in contributions}
                 skills = set()
@@ -256,6 +386,63 @@ def export_contribution_data_to_csv(
         )
 
 
+def export_contribution_data_to_json(
+    contributions: list[Any], export_path: str, period_days: Optional[int] = None
+) -> None:
+    """Export contribution data to JSON format.
+
+    Args:
+        contributions: List of Contribution objects
+        export_path: Path to export the JSON file
+        period_days: Number of days the contributions were filtered to, if any
+    """
+    try:
+        export_data = {
+            "exported_at": datetime.now().isoformat(),
+            "period_days": period_days,
+            "total_contributions": len(contributions),
+            "contributions": [
+                {
+                    "repository": c.repository,
+                    "issue_number": c.issue_number,
+                    "issue_title": c.issue_title,
+                    "issue_url": c.issue_url,
+                    "contribution_type": c.contribution_type,
+                    "status": c.status,
+                    "created_at": c.created_at,
+                    "updated_at": c.updated_at,
+                    "skills_used": c.skills_used,
+                    "impact_score": c.impact_score,
+                    "labels": getattr(c, "labels", []),
+                    "milestone": getattr(c, "milestone", None),
+                    "assignees": getattr(c, "assignees", []),
+                    "comments_count": getattr(c, "comments_count", 0),
+                    "reactions_count": getattr(c, "reactions_count", 0),
+                }
+                for c in contributions
+            ],
+        }
+
+        # Write to file
+        export_file = Path(export_path)
+        export_file.parent.mkdir(parents=True, exist_ok=True)
+
+        _write_json(export_file, export_data)
+
+        print_success_panel(
+            "JSON Export Successful",
+            f"Contribution data exported to: {export_path}",
+        )
+
+    except Exception as e:
+        logger = get_logger()
+        logger.error(f"Failed to export contribution data: {e}")
+        print_error_panel(
+            "JSON Export Failed",
+            f"Failed to export contribution data: {str(e)}",
+        )
+
+
 def export_health_data(
     repositories: Any, health_calculator: Any, export_path: str
 ) -> None:
@@ -326,8 +513,7 @@ def export_health_data(
         export_file = Path(export_path)
         export_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(export_file, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        _write_json(export_file, export_data)
 
         print_success_panel(
             "Export Successful",
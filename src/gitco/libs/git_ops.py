@@ -6,9 +6,12 @@ import re
 import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock, Timer
 from typing import Any, Callable, Optional
 
 import psutil
@@ -113,7 +116,7 @@ class BatchProcessor:
             # Limit cache size to prevent memory issues
             if len(self._repository_cache) >= self._optimal_batch_size:
                 # Remove oldest entries
-                oldest_keys = list(self._repository_cache.keys())[:5]
+                oldest_keys = list(islice(self._repository_cache, 5))
                 for key in oldest_keys:
                     del self._repository_cache[key]
             self._repository_cache[repo_path] = repo_obj
@@ -129,8 +132,9 @@ class BatchProcessor:
     ) -> BatchPerformanceMetrics:
         """Monitor and calculate performance metrics."""
         total_duration = time.time() - start_time
+        total = len(results)
         successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        failed = total - successful
 
         # Calculate memory usage
         memory_mb = psutil.Process().memory_info().rss / (1024 * 1024)
@@ -139,14 +143,14 @@ class BatchProcessor:
         cpu_percent = psutil.cpu_percent(interval=0.1)
 
         # Calculate throughput
-        throughput = len(results) / total_duration if total_duration > 0 else 0
+        throughput = total / total_duration if total_duration > 0 else 0
 
         return BatchPerformanceMetrics(
-            total_repositories=len(results),
+            total_repositories=total,
             successful_operations=successful,
             failed_operations=failed,
             total_duration=total_duration,
-            average_duration=total_duration / len(results) if results else 0,
+            average_duration=total_duration / total if total else 0,
             memory_usage_mb=memory_mb,
             cpu_usage_percent=cpu_percent,
             throughput_repos_per_second=throughput,
@@ -191,37 +195,32 @@ class BatchProcessor:
         if show_progress:
             self._print_batch_header(operation_name, len(repositories))
 
-            # Create progress bar for batch processing
-            with create_progress_bar(
+        # Progress bar only when requested; quiet mode runs the same loop without it
+        progress_context = (
+            create_progress_bar(
                 f"Processing {len(repositories)} repositories", len(repositories)
-            ) as progress:
-                task = progress.add_task(
+            )
+            if show_progress
+            else nullcontext()
+        )
+        with progress_context as progress:
+            task = (
+                progress.add_task(
                     f"[cyan]{operation_name}[/cyan]", total=len(repositories)
                 )
+                if progress is not None
+                else None
+            )
 
-                # Process repositories in batches for better memory management
-                for i in range(0, len(repositories), batch_size):
-                    batch = repositories[i : i + batch_size]
-
-                    # Process current batch with thread pool
-                    batch_results = self._process_batch(
-                        batch, operation_func, operation_name, progress, task
-                    )
-                    results.extend(batch_results)
-
-                    # Clear cache between batches to prevent memory buildup
-                    if i + batch_size < len(repositories):
-                        self._clear_cache()
-        else:
-            # Process without progress bar (for quiet mode)
+            # Process repositories in batches for better memory management
             for i in range(0, len(repositories), batch_size):
                 batch = repositories[i : i + batch_size]
-                batch_results = self._process_batch_quiet(
-                    batch, operation_func, operation_name
+                batch_results = self._process_batch(
+                    batch, operation_func, operation_name, progress, task
                 )
                 results.extend(batch_results)
 
-                # Clear cache between batches
+                # Clear cache between batches to prevent memory buildup
                 if i + batch_size < len(repositories):
                     self._clear_cache()
 
@@ -229,9 +228,7 @@ class BatchProcessor:
         self._performance_metrics = self._monitor_performance(start_time, results)
 
         if show_progress:
-            self._print_batch_summary(
-                results, operation_name, self._performance_metrics.total_duration
-            )
+            self._print_batch_summary(operation_name, self._performance_metrics)
             self._print_performance_metrics(self._performance_metrics)
 
         # Clean up thread pool
@@ -246,10 +243,10 @@ class BatchProcessor:
         batch: list[dict[str, Any]],
         operation_func: Callable[[str, dict[str, Any]], dict[str, Any]],
         operation_name: str,
-        progress: Any,
-        task: Any,
+        progress: Any = None,
+        task: Any = None,
     ) -> list[BatchResult]:
-        """Process a batch of repositories with progress tracking."""
+        """Process a batch of repositories, tracking progress when a bar is given."""
         batch_results = []
         thread_pool = self._get_or_create_thread_pool()
 
@@ -269,17 +266,9 @@ class BatchProcessor:
             repo = future_to_repo[future]
             try:
                 result = future.result()
-                batch_results.append(result)
-
-                # Update progress bar
-                progress.update(task, advance=1)
-
-                # Show result with color coding
-                self._print_repository_result(result)
-
             except Exception as e:
                 # Handle unexpected errors in the future
-                error_result = BatchResult(
+                result = BatchResult(
                     repository_name=repo.get("name", "unknown"),
                     repository_path=repo.get("local_path", "unknown"),
                     success=False,
@@ -289,55 +278,12 @@ class BatchProcessor:
                     duration=0.0,
                     error=e,
                 )
-                batch_results.append(error_result)
+            batch_results.append(result)
 
-                # Update progress bar
+            if progress is not None:
+                # Update progress bar and show result with color coding
                 progress.update(task, advance=1)
-
-                # Show error result
-                self._print_repository_result(error_result)
-
-        return batch_results
-
-    def _process_batch_quiet(
-        self,
-        batch: list[dict[str, Any]],
-        operation_func: Callable[[str, dict[str, Any]], dict[str, Any]],
-        operation_name: str,
-    ) -> list[BatchResult]:
-        """Process a batch of repositories without progress tracking."""
-        batch_results = []
-        thread_pool = self._get_or_create_thread_pool()
-
-        # Submit all tasks in the batch
-        future_to_repo = {
-            thread_pool.submit(
-                self._process_single_repository,
-                repo,
-                operation_func,
-                operation_name,
-            ): repo
-            for repo in batch
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_repo):
-            repo = future_to_repo[future]
-            try:
-                result = future.result()
-                batch_results.append(result)
-            except Exception as e:
-                error_result = BatchResult(
-                    repository_name=repo.get("name", "unknown"),
-                    repository_path=repo.get("local_path", "unknown"),
-                    success=False,
-                    operation=operation_name,
-                    message=f"Unexpected error: {e}",
-                    details={"error": str(e)},
-                    duration=0.0,
-                    error=e,
-                )
-                batch_results.append(error_result)
+                self._print_repository_result(result)
 
         return batch_results
 
@@ -436,17 +382,18 @@ class BatchProcessor:
             )
 
     def _print_batch_summary(
-        self, results: list[BatchResult], operation_name: str, total_duration: float
+        self, operation_name: str, metrics: BatchPerformanceMetrics
     ) -> None:
         """Print batch processing summary with rich table.
 
         Args:
-            results: List of batch results
             operation_name: Name of the operation
-            total_duration: Total duration of the batch operation
+            metrics: Performance metrics holding the success/failure counts
         """
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        total = metrics.total_repositories
+        successful = metrics.successful_operations
+        failed = metrics.failed_operations
+        total_duration = metrics.total_duration
 
         table = Table(
             title=f"Batch {operation_name.title()} Summary",
@@ -458,12 +405,17 @@ class BatchProcessor:
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="white")
 
-        table.add_row("Total Repositories", str(len(results)))
-        table.add_row("Successful", f"[green]{successful}[/green]")
-        table.add_row("Failed", f"[red]{failed}[/red]")
-        table.add_row("Success Rate", f"{(successful / len(results) * 100):.1f}%")
-        table.add_row("Total Duration", f"{total_duration:.2f}s")
-        table.add_row("Average Duration", f"{total_duration / len(results):.2f}s")
+        success_rate = successful * 100 / total if total else 0.0
+        rows = (
+            ("Total Repositories", str(total)),
+            ("Successful", f"[green]{successful}[/green]"),
+            ("Failed", f"[red]{failed}[/red]"),
+            ("Success Rate", f"{success_rate:.1f}%"),
+            ("Total Duration", f"{total_duration:.2f}s"),
+            ("Average Duration", f"{metrics.average_duration:.2f}s"),
+        )
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -1487,16 +1439,13 @@ class GitRepository:
             Detailed diff content as string.
         """
         try:
-            # Get detailed diff with context
-            result = self._run_git_command(
-                ["diff", diff_range, "--unified=3", "--no-color"],
-                capture_output=True,
-                text=True,
+            # Get detailed diff with context, reading no more than is kept
+            diff_content = self._read_git_output(
+                ["diff", diff_range, "--unified=3", "--no-color"], 10000
             )
 
-            if result.returncode == 0 and result.stdout:
+            if diff_content:
                 # Limit the size to avoid overwhelming the AI
-                diff_content = str(result.stdout)
                 if len(diff_content) > 10000:  # Limit to 10KB
                     diff_content = diff_content[:10000] + "\n... (truncated)"
                 return diff_content
@@ -1530,16 +1479,20 @@ class GitRepository:
             if not commit_hashes:
                 return ""
 
-            # Get detailed diff for each commit
+            # Get detailed diff for each commit, reading only what can still
+            # appear before the 10KB cut below
             detailed_diffs = []
+            combined_length = -2  # no separator before the first diff
             for commit_hash in commit_hashes:
-                diff_result = self._run_git_command(
+                if combined_length > 10000:
+                    break
+                diff_output = self._read_git_output(
                     ["show", commit_hash, "--unified=3", "--no-color", "--stat"],
-                    capture_output=True,
-                    text=True,
+                    max(0, 10000 - combined_length - 2),
                 )
-                if diff_result.returncode == 0 and diff_result.stdout:
-                    detailed_diffs.append(diff_result.stdout)
+                if diff_output:
+                    detailed_diffs.append(diff_output)
+                    combined_length += len(diff_output) + 2
 
             if detailed_diffs:
                 combined_diff = "\n\n".join(detailed_diffs)
@@ -1753,6 +1706,64 @@ class GitRepository:
             self.logger.debug(f"Error getting commit info: {e}")
             return {"hash": commit_hash, "info": ""}
 
+    def _read_git_output(self, args: list[str], max_chars: int) -> Optional[str]:
+        """Run a Git command, reading at most ``max_chars + 1`` characters.
+
+        Git is stopped as soon as the limit is passed, so a huge diff costs only
+        the part the caller keeps instead of being captured and decoded whole.
+
+        Args:
+            args: Git command arguments
+            max_chars: Number of characters the caller keeps; one more is read
+                so the caller can tell the output was cut
+
+        Returns:
+            The (possibly cut) output, or None if the command failed
+
+        Raises:
+            GitOperationError: If Git cannot be run or takes longer than 60s
+        """
+        timed_out = Event()
+        try:
+            with subprocess.Popen(
+                ["git"] + args,
+                cwd=self.path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ) as process:
+
+                def _kill_on_timeout() -> None:
+                    timed_out.set()
+                    process.kill()
+
+                # Same 60 second bound as _run_git_command, covering the read
+                timer = Timer(60, _kill_on_timeout)
+                timer.daemon = True
+                timer.start()
+                try:
+                    output = (
+                        process.stdout.read(max_chars + 1) if process.stdout else ""
+                    )
+                    if len(output) > max_chars:
+                        process.kill()
+                    else:
+                        process.wait()
+                finally:
+                    timer.cancel()
+        except Exception as e:
+            raise GitOperationError(
+                f"Failed to run Git command {' '.join(args)}: {e}"
+            ) from e
+
+        if timed_out.is_set():
+            raise GitOperationError(
+                f"Git command timed out after 60s: {' '.join(args)}"
+            )
+        if len(output) > max_chars:
+            return output
+        return output if process.returncode == 0 else None
+
     def _run_git_command(
         self,
         args: list[str],
@@ -1810,6 +1821,8 @@ class GitRepositoryManager:
         repositories: list[dict[str, Any]],
         max_workers: int = 4,
         show_progress: bool = True,
+        stash: bool = True,
+        force: bool = False,
     ) -> list[BatchResult]:
         """Synchronize multiple repositories in batch.
 
@@ -1817,6 +1830,8 @@ class GitRepositoryManager:
             repositories: List of repository configurations
             max_workers: Maximum number of concurrent workers
             show_progress: Whether to show progress indicators
+            stash: Whether to stash uncommitted changes around the sync
+            force: Whether to resolve merge conflicts in favour of upstream
 
         Returns:
             List of batch results for each repository
@@ -1825,7 +1840,9 @@ class GitRepositoryManager:
 
         return self.batch_processor.process_repositories(
             repositories=repositories,
-            operation_func=self._sync_single_repository,
+            operation_func=partial(
+                self._sync_single_repository, stash=stash, force=force
+            ),
             operation_name="sync",
             show_progress=show_progress,
         )
@@ -1881,13 +1898,19 @@ class GitRepositoryManager:
         )
 
     def _sync_single_repository(
-        self, repo_path: str, repo_config: dict[str, Any]
+        self,
+        repo_path: str,
+        repo_config: dict[str, Any],
+        stash: bool = True,
+        force: bool = False,
     ) -> dict[str, Any]:
         """Synchronize a single repository with upstream with error recovery.
 
         Args:
             repo_path: Path to the repository
             repo_config: Repository configuration
+            stash: Whether to stash uncommitted changes around the sync
+            force: Whether to resolve merge conflicts in favour of upstream
 
         Returns:
             Dictionary with sync result information
@@ -1915,6 +1938,15 @@ class GitRepositoryManager:
             has_changes = self.has_uncommitted_changes(repo_path)
             stash_ref = None
 
+            if has_changes and not stash:
+                logger.error(f"Uncommitted changes in {repo_name}, stashing disabled")
+                return {
+                    "success": False,
+                    "message": "Repository has uncommitted changes and stashing "
+                    "is disabled",
+                    "recovery_attempted": False,
+                }
+
             if has_changes:
                 logger.info(f"Found uncommitted changes in {repo_name}, stashing...")
                 stash_ref = self.safe_stash_changes(repo_path)
@@ -1930,6 +1962,24 @@ class GitRepositoryManager:
             # Step 3: Perform sync operation with retry mechanism
             sync_result = self._sync_with_retry(repo_path, repo_name)
 
+            # Step 3b: Take upstream's side of any conflicts when forced
+            if (
+                force
+                and not sync_result.get("success")
+                and sync_result.get("conflicts")
+            ):
+                logger.warning(
+                    f"Resolving {len(sync_result['conflicts'])} conflicts in "
+                    f"{repo_name} in favour of upstream"
+                )
+                if self._force_resolve_merge(repo_path):
+                    sync_result.update(
+                        success=True,
+                        error=None,
+                        merge_success=True,
+                        message="Merged with conflicts resolved from upstream",
+                    )
+
             # Step 4: Restore stashed changes if any
             if stash_ref:
                 logger.info(f"Restoring stashed changes for {repo_name}")
@@ -1957,6 +2007,27 @@ class GitRepositoryManager:
                 "recovery_attempted": False,
             }
 
+    def _force_resolve_merge(self, repo_path: str) -> bool:
+        """Conclude a conflicted merge by taking upstream's version of each file.
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            True if the merge was committed, False otherwise (the merge is
+            aborted so the repository is left as it was before the sync).
+        """
+        repository = GitRepository(repo_path)
+        if repository.resolve_conflicts("theirs"):
+            result = repository._run_git_command(
+                ["commit", "--no-edit"], capture_output=True, text=True
+            )
+            if result.returncode == 0:
+                return True
+            self.logger.error(f"Failed to commit resolved merge: {result.stderr}")
+        repository.abort_merge()
+        return False
+
     def _sync_with_retry(
         self, repo_path: str, repo_name: str, max_retries: int = 3
     ) -> dict[str, Any]:
@@ -2158,19 +2229,31 @@ class GitRepositoryManager:
             self.logger.warning(f"Base path is not a directory: {base_path}")
             return repositories
 
-        # Walk through directory tree looking for .git directories
+        # Walk through directory tree looking for .git directories, without
+        # descending into the .git directories themselves
+        candidates: list[GitRepository] = []
         for root, dirs, _files in os.walk(base_path_obj):
             if ".git" in dirs:
-                repo_path = Path(root)
-                repository = GitRepository(str(repo_path))
+                dirs.remove(".git")
+                candidates.append(GitRepository(root))
 
-                if repository.is_git_repository():
-                    repositories.append(repository)
-                    self.logger.debug(f"Found Git repository: {repo_path}")
-                else:
-                    self.logger.debug(
-                        f"Found .git directory but not valid repository: {repo_path}"
-                    )
+        if not candidates:
+            return repositories
+
+        # Each check shells out to git, so verify candidates concurrently
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(candidates)), thread_name_prefix="gitco-detect"
+        ) as executor:
+            checks = list(executor.map(GitRepository.is_git_repository, candidates))
+
+        for repository, is_repository in zip(candidates, checks):
+            if is_repository:
+                repositories.append(repository)
+                self.logger.debug(f"Found Git repository: {repository.path}")
+            else:
+                self.logger.debug(
+                    f"Found .git directory but not valid repository: {repository.path}"
+                )
 
         return repositories
 
@@ -1,7 +1,11 @@
 """GitHub API client for GitCo."""
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import cached_property, partial
 from typing import Any, Optional
 
 import requests
@@ -24,6 +28,38 @@ from ..utils.exception import (
 from ..utils.rate_limiter import RateLimitedAPIClient, get_rate_limiter
 from ..utils.retry import TIMEOUT_AWARE_RETRY_CONFIG, create_retry_session, with_retry
 
+# Connections kept open per host, matching the largest worker pool so
+# concurrent fetches reuse their TLS connections instead of reconnecting
+_HTTP_POOL_SIZE = 32
+
+# Issue fields requested for each repository alias in batched GraphQL queries
+_GRAPHQL_ISSUE_FIELDS = """
+nodes {
+  number title state body url createdAt updatedAt
+  author { login }
+  milestone { title }
+  labels(first: 20) { nodes { name } }
+  assignees(first: 10) { nodes { login } }
+  comments { totalCount }
+  reactions { totalCount }
+}
+pageInfo { hasNextPage endCursor }
+"""
+
+# GraphQL issue states per REST state filter; None means no state filter
+_GRAPHQL_ISSUE_STATES: dict[str, Optional[list[str]]] = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED"],
+    "all": None,
+}
+
+# Repositories aliased into a single GraphQL query, bounded by node limits
+_GRAPHQL_BATCH_SIZE = 20
+
+# Issues read per repository without an explicit limit, matching the cap the
+# REST search API puts on a single query
+_GRAPHQL_DEFAULT_ISSUE_LIMIT = 1000
+
 
 @dataclass
 class GitHubIssue:
@@ -43,6 +79,16 @@ class GitHubIssue:
     comments_count: int = 0
     reactions_count: int = 0
 
+    @cached_property
+    def labels_display(self) -> str:
+        """Comma-separated labels, or "None" when there are none."""
+        return ", ".join(self.labels) or "None"
+
+    @cached_property
+    def assignees_display(self) -> str:
+        """Comma-separated assignees, or "None" when there are none."""
+        return ", ".join(self.assignees) or "None"
+
 
 @dataclass
 class GitHubRepository:
@@ -101,11 +147,18 @@ class GitHubClient(RateLimitedAPIClient):
         self.read_timeout = read_timeout or timeout
         self.token = token
 
+        # PyGithub repository objects by name; each lookup costs an API call
+        self._repo_cache: dict[str, Any] = {}
+
+        # Rate limits read by test_connection, reused once by get_rate_limit_status
+        self._connection_rate_limit: Any = None
+
         # Create session with retry capabilities
         self.session = create_retry_session(
             max_attempts=max_retries,
             backoff_factor=0.3,
             status_forcelist=[500, 502, 503, 504, 429],
+            pool_maxsize=_HTTP_POOL_SIZE,
         )
 
         # Set up authentication
@@ -154,21 +207,31 @@ class GitHubClient(RateLimitedAPIClient):
         """
         if token:
             # Use token authentication (preferred)
-            self.github = Github(token, base_url=self.base_url)
+            self.github = Github(
+                token, base_url=self.base_url, pool_size=_HTTP_POOL_SIZE
+            )
             self.auth_method = "token"
         elif username and password:
             # Use basic authentication
-            self.github = Github(username, password, base_url=self.base_url)
+            self.github = Github(
+                username,
+                password,
+                base_url=self.base_url,
+                pool_size=_HTTP_POOL_SIZE,
+            )
             self.auth_method = "basic"
         else:
             # Try to get token from environment
             token = os.getenv("GITHUB_TOKEN")
             if token:
-                self.github = Github(token, base_url=self.base_url)
+                self.github = Github(
+                    token, base_url=self.base_url, pool_size=_HTTP_POOL_SIZE
+                )
                 self.auth_method = "token"
+                self.token = token
             else:
                 # Anonymous access (limited API access)
-                self.github = Github(base_url=self.base_url)
+                self.github = Github(base_url=self.base_url, pool_size=_HTTP_POOL_SIZE)
                 self.auth_method = "anonymous"
 
     def _test_authentication(self) -> None:
@@ -298,6 +361,20 @@ class GitHubClient(RateLimitedAPIClient):
                 f"GitHub API error: {response.status_code} - {response.text}"
             )
 
+    def _get_repo(self, repo_name: str) -> Any:
+        """Get the PyGithub repository object, fetching it once per client.
+
+        Args:
+            repo_name: Repository name (owner/repo)
+
+        Returns:
+            PyGithub repository object
+        """
+        repo = self._repo_cache.get(repo_name)
+        if repo is None:
+            repo = self._repo_cache[repo_name] = self.github.get_repo(repo_name)
+        return repo
+
     def get_repository(self, repo_name: str) -> Optional[GitHubRepository]:
         """Get repository information.
 
@@ -313,7 +390,7 @@ class GitHubClient(RateLimitedAPIClient):
         log_operation_start("github repository fetch", repo_name=repo_name)
 
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
 
             github_repo = GitHubRepository(
                 name=repo.name,
@@ -381,16 +458,20 @@ class GitHubClient(RateLimitedAPIClient):
 
         try:
             # Get repository for validation
-            self.github.get_repo(repo_name)
-            issues = []
+            self._get_repo(repo_name)
 
             # Build query parameters
-            query_parts = [f"repo:{repo_name}", f"state:{state}"]
+            # Search also matches pull requests unless restricted to issues
+            query_parts = [f"repo:{repo_name}", "is:issue", f"state:{state}"]
 
             if labels:
                 for label in labels:
                     query_parts.append(f'label:"{label}"')
 
+            if exclude_labels:
+                for label in exclude_labels:
+                    query_parts.append(f'-label:"{label}"')
+
             if assignee:
                 query_parts.append(f"assignee:{assignee}")
 
@@ -410,40 +491,12 @@ class GitHubClient(RateLimitedAPIClient):
                 query, sort="updated", order="desc"
             )
 
-            # Apply limit
+            # Apply limit; slicing lazily fetches only the pages it needs
             if limit:
-                search_results = list(search_results)[:limit]
-
-            # Filter out excluded labels
-            if exclude_labels:
-                search_results = [
-                    issue
-                    for issue in search_results
-                    if not any(label.name in exclude_labels for label in issue.labels)
-                ]
+                search_results = search_results[:limit]
 
             # Convert to our data structure
-            for issue in search_results:
-                github_issue = GitHubIssue(
-                    number=issue.number,
-                    title=issue.title,
-                    state=issue.state,
-                    labels=[label.name for label in issue.labels],
-                    assignees=[assignee.login for assignee in issue.assignees],
-                    created_at=issue.created_at.isoformat(),
-                    updated_at=issue.updated_at.isoformat(),
-                    html_url=issue.html_url,
-                    body=issue.body,
-                    user=issue.user.login if issue.user else None,
-                    milestone=issue.milestone.title if issue.milestone else None,
-                    comments_count=issue.comments,
-                    reactions_count=(
-                        len(issue.get_reactions())
-                        if hasattr(issue, "get_reactions")
-                        else 0
-                    ),
-                )
-                issues.append(github_issue)
+            issues = [self._issue_from_rest(issue) for issue in search_results]
 
             log_operation_success("github issues fetch", repo_name=repo_name)
             return issues
@@ -462,6 +515,7 @@ class GitHubClient(RateLimitedAPIClient):
         exclude_labels: Optional[list[str]] = None,
         created_after: Optional[str] = None,
         updated_after: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> list[GitHubIssue]:
         """Search for issues across repositories.
 
@@ -474,6 +528,7 @@ class GitHubClient(RateLimitedAPIClient):
             exclude_labels: List of labels to exclude
             created_after: Filter issues created after this date
             updated_after: Filter issues updated after this date
+            max_workers: Maximum number of issues to convert concurrently
 
         Returns:
             List of GitHub issues
@@ -488,6 +543,10 @@ class GitHubClient(RateLimitedAPIClient):
                 for label in labels:
                     search_parts.append(f'label:"{label}"')
 
+            if exclude_labels:
+                for label in exclude_labels:
+                    search_parts.append(f'-label:"{label}"')
+
             if language:
                 search_parts.append(f"language:{language}")
 
@@ -504,41 +563,23 @@ class GitHubClient(RateLimitedAPIClient):
                 search_query, sort="updated", order="desc"
             )
 
-            # Apply limit
+            # Apply limit; slicing lazily fetches only the pages it needs
             if limit:
-                search_results = list(search_results)[:limit]
-
-            # Filter out excluded labels
-            if exclude_labels:
-                search_results = [
-                    issue
-                    for issue in search_results
-                    if not any(label.name in exclude_labels for label in issue.labels)
-                ]
-
-            # Convert to our data structure
-            issues = []
-            for issue in search_results:
-                github_issue = GitHubIssue(
-                    number=issue.number,
-                    title=issue.title,
-                    state=issue.state,
-                    labels=[label.name for label in issue.labels],
-                    assignees=[assignee.login for assignee in issue.assignees],
-                    created_at=issue.created_at.isoformat(),
-                    updated_at=issue.updated_at.isoformat(),
-                    html_url=issue.html_url,
-                    body=issue.body,
-                    user=issue.user.login if issue.user else None,
-                    milestone=issue.milestone.title if issue.milestone else None,
-                    comments_count=issue.comments,
-                    reactions_count=(
-                        len(issue.get_reactions())
-                        if hasattr(issue, "get_reactions")
-                        else 0
-                    ),
+                search_results = search_results[:limit]
+
+            # Convert to our data structure; each conversion requests the
+            # issue's reactions, so issues are converted concurrently
+            workers = min(32, max_workers or 1)
+            executor_context = (
+                ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="gitco-search"
                 )
-                issues.append(github_issue)
+                if workers > 1
+                else nullcontext()
+            )
+            with executor_context as executor:
+                mapper = executor.map if executor is not None else map
+                issues = list(mapper(self._issue_from_rest, search_results))
 
             log_operation_success("github issues search", query=query)
             return issues
@@ -547,6 +588,186 @@ class GitHubClient(RateLimitedAPIClient):
             log_operation_failure("github issues search", e, query=query)
             raise APIError(f"Failed to search issues: {e}") from e
 
+    @staticmethod
+    def _issue_from_rest(issue: Any) -> GitHubIssue:
+        """Convert a PyGithub issue to our issue data structure.
+
+        Args:
+            issue: Issue returned by the REST API
+
+        Returns:
+            GitHub issue
+        """
+        # Label names, states and logins repeat across thousands of issues;
+        # interning keeps one copy of each string
+        return GitHubIssue(
+            number=issue.number,
+            title=issue.title,
+            state=sys.intern(issue.state),
+            labels=[sys.intern(label.name) for label in issue.labels],
+            assignees=[sys.intern(assignee.login) for assignee in issue.assignees],
+            created_at=issue.created_at.isoformat(),
+            updated_at=issue.updated_at.isoformat(),
+            html_url=issue.html_url,
+            body=issue.body,
+            user=sys.intern(issue.user.login) if issue.user else None,
+            milestone=issue.milestone.title if issue.milestone else None,
+            comments_count=issue.comments,
+            reactions_count=(
+                len(issue.get_reactions()) if hasattr(issue, "get_reactions") else 0
+            ),
+        )
+
+    @staticmethod
+    def _issue_from_graphql(node: dict[str, Any]) -> GitHubIssue:
+        """Convert a GraphQL issue node to our issue data structure.
+
+        Args:
+            node: Issue node from a GraphQL response
+
+        Returns:
+            GitHub issue
+        """
+        return GitHubIssue(
+            number=node["number"],
+            title=node["title"],
+            state=sys.intern(node["state"].lower()),
+            labels=[sys.intern(label["name"]) for label in node["labels"]["nodes"]],
+            assignees=[
+                sys.intern(user["login"]) for user in node["assignees"]["nodes"]
+            ],
+            # Match the offset format of the REST path's isoformat()
+            created_at=node["createdAt"].replace("Z", "+00:00"),
+            updated_at=node["updatedAt"].replace("Z", "+00:00"),
+            html_url=node["url"],
+            body=node["body"],
+            user=sys.intern(node["author"]["login"]) if node["author"] else None,
+            milestone=node["milestone"]["title"] if node["milestone"] else None,
+            comments_count=node["comments"]["totalCount"],
+            reactions_count=node["reactions"]["totalCount"],
+        )
+
+    def get_issues_graphql(
+        self,
+        repositories: list[str],
+        state: str = "open",
+        labels: Optional[list[str]] = None,
+        exclude_labels: Optional[list[str]] = None,
+        assignee: Optional[str] = None,
+        limit_per_repo: Optional[int] = None,
+    ) -> dict[str, list[GitHubIssue]]:
+        """Get issues for multiple repositories with batched GraphQL queries.
+
+        Each round requests one page of issues for every repository that
+        still has issues to read, aliasing the repositories into a single
+        query. As with the REST search, an issue must carry all of ``labels``,
+        and without ``limit_per_repo`` at most 1000 issues are read per
+        repository.
+
+        Args:
+            repositories: List of repository names (owner/repo)
+            state: Issue state (open, closed, all)
+            labels: List of labels to include
+            exclude_labels: List of labels to exclude
+            assignee: Assignee filter
+            limit_per_repo: Maximum issues per repository
+
+        Returns:
+            Dictionary mapping repository names to lists of issues
+
+        Raises:
+            APIError: If a query fails or reports errors
+        """
+        limit = limit_per_repo or _GRAPHQL_DEFAULT_ISSUE_LIMIT
+        required_labels = set(labels or ())
+        excluded_labels = set(exclude_labels or ())
+        variables: dict[str, Any] = {
+            "first": min(100, limit),
+            "states": _GRAPHQL_ISSUE_STATES[state],
+            # Narrows to issues with any of the labels; all are checked below
+            "labels": labels or None,
+            "filterBy": {"assignee": assignee} if assignee else None,
+        }
+        headers = {"Authorization": f"bearer {self.token}"}
+
+        all_issues: dict[str, list[GitHubIssue]] = {
+            repo_name: [] for repo_name in repositories
+        }
+        cursors: dict[str, Optional[str]] = dict.fromkeys(repositories)
+        pending = list(all_issues)
+
+        while pending:
+            next_pending = []
+            for start in range(0, len(pending), _GRAPHQL_BATCH_SIZE):
+                batch = pending[start : start + _GRAPHQL_BATCH_SIZE]
+                params = [
+                    "$first: Int!",
+                    "$states: [IssueState!]",
+                    "$labels: [String!]",
+                    "$filterBy: IssueFilters",
+                ]
+                fields = []
+                batch_variables = dict(variables)
+                for i, repo_name in enumerate(batch):
+                    owner, _, name = repo_name.partition("/")
+                    params.append(f"$o{i}: String!, $n{i}: String!, $c{i}: String")
+                    batch_variables.update(
+                        {f"o{i}": owner, f"n{i}": name, f"c{i}": cursors[repo_name]}
+                    )
+                    fields.append(
+                        f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ "
+                        f"issues(first: $first, after: $c{i}, states: $states, "
+                        f"labels: $labels, filterBy: $filterBy, "
+                        f"orderBy: {{field: UPDATED_AT, direction: DESC}}) "
+                        f"{{ {_GRAPHQL_ISSUE_FIELDS} }} }}"
+                    )
+                query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+                response = self._make_request(
+                    "POST",
+                    "/graphql",
+                    data={"query": query, "variables": batch_variables},
+                    headers=headers,
+                )
+                if response.get("errors"):
+                    raise APIError(f"GitHub GraphQL error: {response['errors']}")
+
+                for i, repo_name in enumerate(batch):
+                    connection = response["data"][f"r{i}"]["issues"]
+                    repo_issues = all_issues[repo_name]
+                    for node in connection["nodes"]:
+                        issue = self._issue_from_graphql(node)
+                        if required_labels.issubset(
+                            issue.labels
+                        ) and excluded_labels.isdisjoint(issue.labels):
+                            repo_issues.append(issue)
+                    del repo_issues[limit:]
+
+                    page_info = connection["pageInfo"]
+                    if page_info["hasNextPage"] and len(repo_issues) < limit:
+                        cursors[repo_name] = page_info["endCursor"]
+                        next_pending.append(repo_name)
+            pending = next_pending
+
+        return all_issues
+
+    def _get_issues_or_empty(self, repo_name: str, **kwargs: Any) -> list[GitHubIssue]:
+        """Get issues for a repository, logging failures as an empty result.
+
+        Args:
+            repo_name: Repository name (owner/repo)
+            **kwargs: Filters passed through to ``get_issues``
+
+        Returns:
+            List of GitHub issues, empty if the fetch failed
+        """
+        try:
+            return self.get_issues(repo_name=repo_name, **kwargs)
+        except Exception as e:
+            # Log error but continue with other repositories
+            self.logger.warning(f"Failed to fetch issues for {repo_name}: {e}")
+            return []
+
     def get_issues_for_repositories(
         self,
         repositories: list[str],
@@ -559,6 +780,7 @@ class GitHubClient(RateLimitedAPIClient):
         total_limit: Optional[int] = None,
         created_after: Optional[str] = None,
         updated_after: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> dict[str, list[GitHubIssue]]:
         """Get issues for multiple repositories.
 
@@ -573,6 +795,8 @@ class GitHubClient(RateLimitedAPIClient):
             total_limit: Maximum total issues across all repositories
             created_after: Filter issues created after this date
             updated_after: Filter issues updated after this date
+            max_workers: Maximum repositories fetched concurrently (default:
+                one per repository, capped at 32)
 
         Returns:
             Dictionary mapping repository names to lists of issues
@@ -581,24 +805,64 @@ class GitHubClient(RateLimitedAPIClient):
             "github multi-repo issues fetch", repo_count=len(repositories)
         )
 
+        # One batched GraphQL round trip replaces a REST search per repository
+        # when the filters map onto GraphQL and a token is available
+        if (
+            len(repositories) > 1
+            and self.token
+            and self.base_url == "https://api.github.com"
+            and state in _GRAPHQL_ISSUE_STATES
+            and not (milestone or total_limit or created_after or updated_after)
+        ):
+            try:
+                graphql_issues = self.get_issues_graphql(
+                    repositories,
+                    state=state,
+                    labels=labels,
+                    exclude_labels=exclude_labels,
+                    assignee=assignee,
+                    limit_per_repo=limit_per_repo,
+                )
+                log_operation_success(
+                    "github multi-repo issues fetch", repo_count=len(repositories)
+                )
+                return graphql_issues
+            except Exception as e:
+                self.logger.warning(
+                    f"GraphQL issues fetch failed, falling back to REST: {e}"
+                )
+
         try:
             all_issues: dict[str, list[GitHubIssue]] = {}
             total_issues = 0
 
-            for repo_name in repositories:
-                try:
-                    repo_issues = self.get_issues(
-                        repo_name=repo_name,
-                        state=state,
-                        labels=labels,
-                        assignee=assignee,
-                        milestone=milestone,
-                        limit=limit_per_repo,
-                        exclude_labels=exclude_labels,
-                        created_after=created_after,
-                        updated_after=updated_after,
-                    )
+            fetch_issues = partial(
+                self._get_issues_or_empty,
+                state=state,
+                labels=labels,
+                assignee=assignee,
+                milestone=milestone,
+                limit=limit_per_repo,
+                exclude_labels=exclude_labels,
+                created_after=created_after,
+                updated_after=updated_after,
+            )
 
+            # Repositories are fetched concurrently, except with a total limit,
+            # where the lazy serial map stops fetching once the limit is reached
+            workers = min(32, max_workers or len(repositories))
+            executor_context = (
+                ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="gitco-issues"
+                )
+                if workers > 1 and not total_limit
+                else nullcontext()
+            )
+            with executor_context as executor:
+                mapper = executor.map if executor is not None else map
+                for repo_name, repo_issues in zip(
+                    repositories, mapper(fetch_issues, repositories)
+                ):
                     all_issues[repo_name] = repo_issues
                     total_issues += len(repo_issues)
 
@@ -606,11 +870,6 @@ class GitHubClient(RateLimitedAPIClient):
                     if total_limit and total_issues >= total_limit:
                         break
 
-                except Exception as e:
-                    # Log error but continue with other repositories
-                    self.logger.warning(f"Failed to fetch issues for {repo_name}: {e}")
-                    all_issues[repo_name] = []
-
             log_operation_success(
                 "github multi-repo issues fetch", repo_count=len(repositories)
             )
@@ -631,7 +890,10 @@ class GitHubClient(RateLimitedAPIClient):
             Dictionary with rate limit information
         """
         try:
-            rate_limit = self.github.get_rate_limit()
+            # Reuse the limits read by test_connection instead of a second request
+            rate_limit, self._connection_rate_limit = self._connection_rate_limit, None
+            if rate_limit is None:
+                rate_limit = self.github.get_rate_limit()
 
             def get_reset_timestamp(reset_value: Any) -> int:
                 """Get reset timestamp, handling both datetime and int."""
@@ -665,12 +927,14 @@ class GitHubClient(RateLimitedAPIClient):
     def test_connection(self) -> bool:
         """Test connection to GitHub API.
 
+        The probe reads the rate limits, which checks the credentials without
+        using quota and saves get_rate_limit_status a request.
+
         Returns:
             True if connection is successful
         """
         try:
-            # Try to get current user to test connection
-            self.github.get_user()
+            self._connection_rate_limit = self.github.get_rate_limit()
             return True
         except Exception:
             return False
@@ -1,5 +1,6 @@
 """Repository health metrics calculation for GitCo."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +17,18 @@ from .config import Config
 from .git_ops import GitRepository
 from .github_client import GitHubClient
 
+# Health statuses counted as healthy / critical in summaries
+_HEALTHY_STATUSES = frozenset({"excellent", "good"})
+_CRITICAL_STATUSES = frozenset({"poor", "critical"})
+
+# Sync health factor per sync status; unknown statuses score 0.5
+_SYNC_STATUS_SCORES = {
+    "up_to_date": 1.0,
+    "behind": 0.7,
+    "ahead": 0.8,
+    "diverged": 0.3,
+}
+
 
 @dataclass
 class RepositoryHealthMetrics:
@@ -114,6 +127,8 @@ class RepositoryHealthCalculator:
         self.config = config
         self.github_client = github_client
         self.logger = get_logger()
+        # Metrics already computed by this calculator, keyed by (name, path)
+        self._health_cache: dict[tuple[str, str], RepositoryHealthMetrics] = {}
 
     def calculate_repository_health(
         self, repository_config: dict[str, Any]
@@ -129,6 +144,13 @@ class RepositoryHealthCalculator:
         repo_name = repository_config.get("name", "unknown")
         repo_path = repository_config.get("local_path", "")
 
+        # A summary pass followed by per-repository output asks for the same
+        # repositories twice; reuse the metrics instead of re-querying GitHub
+        cache_key = (repo_name, repo_path)
+        cached = self._health_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         log_operation_start("calculating repository health", repository=repo_name)
 
         try:
@@ -156,6 +178,7 @@ class RepositoryHealthCalculator:
                 health_score=metrics.overall_health_score,
             )
 
+            self._health_cache[cache_key] = metrics
             return metrics
 
         except Exception as e:
@@ -185,15 +208,25 @@ class RepositoryHealthCalculator:
 
         try:
             summary = HealthSummary(total_repositories=len(repositories))
-            repository_metrics = []
 
-            # Calculate metrics for each repository
-            for repo_config in repositories:
-                metrics = self.calculate_repository_health(repo_config)
-                repository_metrics.append(metrics)
+            # Calculate metrics for each repository concurrently; the work is
+            # git and GitHub I/O, and max_repos_per_batch caps the API fan-out
+            max_workers = max(
+                1,
+                min(32, self.config.settings.max_repos_per_batch, len(repositories)),
+            )
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="gitco-health"
+            ) as executor:
+                repository_metrics = list(
+                    executor.map(self.calculate_repository_health, repositories)
+                )
 
-                # Update summary counters
+            # Update summary counters and the health score total in one pass
+            health_score_total = 0.0
+            for metrics in repository_metrics:
                 self._update_summary_counters(summary, metrics)
+                health_score_total += metrics.overall_health_score
 
             # Calculate trending repositories
             summary.trending_repositories = self._identify_trending_repositories(
@@ -205,9 +238,9 @@ class RepositoryHealthCalculator:
 
             # Calculate averages
             if repository_metrics:
-                summary.average_activity_score = sum(
-                    m.overall_health_score for m in repository_metrics
-                ) / len(repository_metrics)
+                summary.average_activity_score = health_score_total / len(
+                    repository_metrics
+                )
 
             log_operation_success(
                 "calculating health summary",
@@ -414,18 +447,7 @@ class RepositoryHealthCalculator:
                 health_factors.append(("activity", activity_score, 0.3))
 
             # Factor 2: Sync status (25%)
-            sync_score = 1.0
-            if metrics.sync_status == "up_to_date":
-                sync_score = 1.0
-            elif metrics.sync_status == "behind":
-                sync_score = 0.7
-            elif metrics.sync_status == "ahead":
-                sync_score = 0.8
-            elif metrics.sync_status == "diverged":
-                sync_score = 0.3
-            else:
-                sync_score = 0.5
-
+            sync_score = _SYNC_STATUS_SCORES.get(metrics.sync_status, 0.5)
             health_factors.append(("sync", sync_score, 0.25))
 
             # Factor 3: Contributor engagement (20%)
@@ -492,11 +514,11 @@ class RepositoryHealthCalculator:
             metrics: Repository metrics
         """
         # Health status counters
-        if metrics.health_status == "excellent" or metrics.health_status == "good":
+        if metrics.health_status in _HEALTHY_STATUSES:
             summary.healthy_repositories += 1
         elif metrics.health_status == "fair":
             summary.needs_attention_repositories += 1
-        elif metrics.health_status == "poor" or metrics.health_status == "critical":
+        elif metrics.health_status in _CRITICAL_STATUSES:
             summary.critical_repositories += 1
 
         # Activity counters
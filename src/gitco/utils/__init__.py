@@ -2,15 +2,32 @@
 Utility modules for gitco.
 
 This package contains common utilities used throughout the gitco application.
+Submodules are imported on first attribute access, so importing
+``gitco.utils.common`` does not also pull in the HTTP stack used by
+``retry`` and ``rate_limiter``.
 """
 
-from . import common, exception, logging, prompts, rate_limiter, retry
+import importlib
+from typing import Any
 
-__all__ = [
-    # Re-export all public symbols from submodules
-    *common.__all__,
-    *exception.__all__,
-    *logging.__all__,
-    *prompts.__all__,
-    *retry.__all__,
-]
+# Submodules whose public symbols are re-exported, in lookup order
+_REEXPORTED_MODULES = ("common", "exception", "logging", "prompts", "retry")
+_SUBMODULES = frozenset((*_REEXPORTED_MODULES, "rate_limiter"))
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve submodules and their re-exported public symbols."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "__all__":
+        # Re-export all public symbols from submodules
+        return [
+            symbol
+            for module_name in _REEXPORTED_MODULES
+            for symbol in importlib.import_module(f".{module_name}", __name__).__all__
+        ]
+    for module_name in _REEXPORTED_MODULES:
+        module = importlib.import_module(f".{module_name}", __name__)
+        if name in module.__all__:
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,11 +4,13 @@ import logging
 import logging.handlers
 import os
 import sys
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -686,26 +688,59 @@ def print_status_table(
     console.print(table)
 
 
-def print_success_panel(message: str, details: Optional[str] = None) -> None:
-    """Print a success panel using rich.
+def _build_status_panel(
+    message: str, details: Optional[str], title: str, border_style: str
+) -> Panel:
+    """Build a status panel.
 
     Args:
-        message: Success message
+        message: Panel message
         details: Optional details
+        title: Panel title
+        border_style: Panel border style
     """
     content = message
     if details:
         content = f"{message}\n\n{details}"
 
-    panel = Panel(
+    return Panel(
         content,
-        title="✅ Success",
-        border_style="green",
+        title=title,
+        border_style=border_style,
         box=box.ROUNDED,
     )
+
+
+@lru_cache(maxsize=64)
+def _status_panel(
+    message: str, details: Optional[str], title: str, border_style: str
+) -> Panel:
+    """Build a status panel; repeated messages reuse the cached Panel."""
+    return _build_status_panel(message, details, title, border_style)
+
+
+def _print_status_panel(
+    message: str, details: Optional[str], title: str, border_style: str
+) -> None:
+    """Print a status panel, building it through the panel cache when possible."""
+    try:
+        panel = _status_panel(message, details, title, border_style)
+    except TypeError:
+        # Unhashable content (e.g. a rich Text) cannot be cached
+        panel = _build_status_panel(message, details, title, border_style)
     console.print(panel)
 
 
+def print_success_panel(message: str, details: Optional[str] = None) -> None:
+    """Print a success panel using rich.
+
+    Args:
+        message: Success message
+        details: Optional details
+    """
+    _print_status_panel(message, details, "✅ Success", "green")
+
+
 def print_error_panel(message: str, details: Optional[str] = None) -> None:
     """Print an error panel using rich.
 
@@ -713,17 +748,7 @@ def print_error_panel(message: str, details: Optional[str] = None) -> None:
         message: Error message
         details: Optional details
     """
-    content = message
-    if details:
-        content = f"{message}\n\n{details}"
-
-    panel = Panel(
-        content,
-        title="❌ Error",
-        border_style="red",
-        box=box.ROUNDED,
-    )
-    console.print(panel)
+    _print_status_panel(message, details, "❌ Error", "red")
 
 
 def print_info_panel(message: str, details: Optional[str] = None) -> None:
@@ -733,17 +758,23 @@ def print_info_panel(message: str, details: Optional[str] = None) -> None:
         message: Info message
         details: Optional details
     """
-    content = message
-    if details:
-        content = f"{message}\n\n{details}"
+    _print_status_panel(message, details, "ℹ️  Info", "blue")
 
-    panel = Panel(
-        content,
-        title="ℹ️  Info",
-        border_style="blue",
-        box=box.ROUNDED,
+
+def print_info_panels(panels: Iterable[tuple[str, Optional[str]]]) -> None:
+    """Print several info panels with a single console write.
+
+    Args:
+        panels: (message, details) pairs, one per panel
+    """
+    console.print(
+        Group(
+            *(
+                _build_status_panel(message, details, "ℹ️  Info", "blue")
+                for message, details in panels
+            )
+        )
     )
-    console.print(panel)
 
 
 def print_warning_panel(message: str, details: Optional[str] = None) -> None:
@@ -753,17 +784,7 @@ def print_warning_panel(message: str, details: Optional[str] = None) -> None:
         message: Warning message
         details: Optional details
     """
-    content = message
-    if details:
-        content = f"{message}\n\n{details}"
-
-    panel = Panel(
-        content,
-        title="⚠️  Warning",
-        border_style="yellow",
-        box=box.ROUNDED,
-    )
-    console.print(panel)
+    _print_status_panel(message, details, "⚠️  Warning", "yellow")
 
 
 def log_configuration_loaded(config_path: str, repo_count: int) -> None:
@@ -3,6 +3,8 @@
 import json
 import time
 from dataclasses import dataclass, field
+from math import fsum
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Optional
 
@@ -12,6 +14,8 @@ from rich.table import Table
 
 from .common import get_logger
 
+_total_cost = attrgetter("total_cost_usd")
+
 
 @dataclass
 class TokenUsage:
@@ -312,10 +316,11 @@ class CostOptimizer:
             Total cost in USD.
         """
         cutoff_time = time.time() - (days * 24 * 3600)
-        recent_usage = [
-            usage for usage in self.cost_history if usage.timestamp >= cutoff_time
-        ]
-        return sum(usage.total_cost_usd for usage in recent_usage)
+        return fsum(
+            usage.total_cost_usd
+            for usage in self.cost_history
+            if usage.timestamp >= cutoff_time
+        )
 
     def get_monthly_cost(self, months: int = 1) -> float:
         """Get total cost for the last N months.
@@ -327,10 +332,11 @@ class CostOptimizer:
             Total cost in USD.
         """
         cutoff_time = time.time() - (months * 30 * 24 * 3600)
-        recent_usage = [
-            usage for usage in self.cost_history if usage.timestamp >= cutoff_time
-        ]
-        return sum(usage.total_cost_usd for usage in recent_usage)
+        return fsum(
+            usage.total_cost_usd
+            for usage in self.cost_history
+            if usage.timestamp >= cutoff_time
+        )
 
     def get_cost_summary(self) -> dict[str, Any]:
         """Get comprehensive cost summary.
@@ -349,7 +355,7 @@ class CostOptimizer:
             }
 
         # Calculate totals
-        total_cost = sum(usage.total_cost_usd for usage in self.cost_history)
+        total_cost = fsum(map(_total_cost, self.cost_history))
         total_requests = len(self.cost_history)
 
         # Group by provider
@@ -462,6 +462,7 @@ def create_retry_session(
     status_forcelist: Optional[list[int]] = None,
     allowed_methods: Optional[list[str]] = None,
     timeout: Optional[float] = None,
+    pool_maxsize: int = 10,
 ) -> requests.Session:
     """Create a requests session with retry capabilities.
 
@@ -471,6 +472,7 @@ def create_retry_session(
         status_forcelist: HTTP status codes to retry on
         allowed_methods: HTTP methods to retry on
         timeout: Request timeout in seconds
+        pool_maxsize: Connections kept open per host
 
     Returns:
         Requests session with retry capabilities
@@ -489,7 +491,7 @@ def create_retry_session(
         respect_retry_after_header=True,
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)